@@ -3,13 +3,140 @@ Financial Analyst Agent - Quantitative Analysis & Ratios
 Fetches financial data and computes key metrics and ratios.
 """
 
-from typing import Dict, Any
-from openai import OpenAI
+import bisect
+import logging
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from config.settings import get_settings
-from utils.api_clients import FinancialAPIClient
+from utils.api_clients import FinancialAPIClient, get_openai_client
 from utils.formatters import format_financial_data, format_metric_analysis
+from utils.llm_cache import cached_completion
 from memory.vector_store import VectorStore
 
+logger = logging.getLogger(__name__)
+
+
+# Classification tables: thresholds are ascending upper bounds and each
+# label tuple has one more entry than its thresholds tuple.
+_PE_THRESHOLDS = (15, 25)
+_PE_LABELS = ('Undervalued', 'Fairly Valued', 'Overvalued')
+
+_PEG_THRESHOLDS = (1, 2)
+_PEG_LABELS = (
+    'Potentially undervalued relative to growth',
+    'Fairly valued relative to growth',
+    'Expensive relative to growth'
+)
+
+_DEBT_THRESHOLDS = (0.5, 1.0)
+_DEBT_LABELS = ('Conservative (Low leverage)', 'Moderate leverage', 'High leverage (Higher risk)')
+
+_LIQUIDITY_THRESHOLDS = (1.0, 2.0)
+_LIQUIDITY_LABELS = ('Poor (Potential liquidity issues)', 'Adequate', 'Strong')
+
+_ROE_THRESHOLDS = (0.10, 0.20)
+_ROE_LABELS = ('Below average', 'Good', 'Excellent')
+
+# Growth and momentum bands are exclusive lower bounds (value > threshold),
+# so they are looked up with bisect_left.
+_GROWTH_THRESHOLDS = (0, 0.10, 0.20)
+_GROWTH_LABELS = ('Negative growth', 'Slow growth', 'Moderate growth', 'High growth')
+
+_MOMENTUM_THRESHOLDS = (-20, 0, 20)
+_MOMENTUM_LABELS = (
+    'Strong downward momentum',
+    'Negative momentum',
+    'Positive momentum',
+    'Strong upward momentum'
+)
+
+_VOLATILITY_THRESHOLDS = (20, 40)
+_VOLATILITY_LABELS = ('Low volatility (Stable)', 'Moderate volatility', 'High volatility (Risky)')
+
+_BETA_THRESHOLDS = (0.8, 1.2)
+_BETA_LABELS = (
+    'Defensive (Less volatile than market)',
+    'Market-correlated',
+    'Aggressive (More volatile than market)'
+)
+
+_RISK_LEVELS = ('Low', 'Medium', 'High')
+
+
+_INSIGHTS_SYSTEM_MESSAGE = {"role": "system", "content": "You are a quantitative financial analyst."}
+
+_INSIGHTS_TEMPLATE = """Analyze the following financial data for {ticker} and provide key insights:
+
+Financial Data:
+{data_summary}
+
+Metric Analysis:
+{metric_analysis}
+
+Provide:
+1. 3-4 key strengths from a financial perspective
+2. 3-4 key concerns or weaknesses
+3. Overall financial assessment (2-3 sentences)
+
+Be concise and focus on the most important financial indicators.
+"""
+
+
+def _digitize_labels(
+    values: np.ndarray,
+    thresholds: tuple,
+    labels: tuple,
+    valid: np.ndarray = None,
+    right: bool = False
+) -> np.ndarray:
+    """
+    Vectorized counterpart of the bisect lookups used for single tickers.
+
+    Args:
+        values: Metric values, one per ticker
+        thresholds: Ascending threshold tuple
+        labels: Label tuple with len(thresholds) + 1 entries
+        valid: Optional mask; entries outside it are labelled 'Unknown'
+        right: Use exclusive lower bounds (matches bisect_left)
+
+    Returns:
+        Array of category labels
+    """
+    categories = np.asarray(labels, dtype=object)[np.digitize(values, thresholds, right=right)]
+    if valid is not None:
+        categories = np.where(valid, categories, 'Unknown')
+    return categories
+
+
+def _classify_risk(volatility: Any, beta: Any) -> tuple:
+    """
+    Classify volatility, beta and overall risk as integer codes.
+
+    Operates element-wise, so it serves both single tickers and the batch
+    screen. Volatility and beta codes index their label tables, with -1
+    meaning the value is unavailable; the overall code indexes _RISK_LEVELS.
+
+    Args:
+        volatility: Annualized volatility in percent (scalar or array)
+        beta: Beta relative to the market (scalar or array)
+
+    Returns:
+        Tuple of (volatility_code, beta_code, risk_code) arrays
+    """
+    volatility = np.asarray(volatility, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+
+    volatility_code = np.where(volatility > 0, np.digitize(volatility, _VOLATILITY_THRESHOLDS), -1)
+    beta_code = np.where(beta > 0, np.digitize(beta, _BETA_THRESHOLDS), -1)
+    risk_code = np.select(
+        [(volatility > 40) | (beta > 1.5), (volatility < 20) & (beta < 0.8)],
+        [2, 0],
+        default=1
+    )
+
+    return volatility_code, beta_code, risk_code
+
 
 class FinancialAnalystAgent:
     """
@@ -25,25 +152,27 @@ class FinancialAnalystAgent:
             vector_store: Shared vector memory for storing findings
         """
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.financial_client = FinancialAPIClient()
         self.vector_store = vector_store
         self.name = "FinancialAnalystAgent"
 
-    def analyze(self, ticker: str) -> Dict[str, Any]:
+    def analyze(self, ticker: str, stock_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Conduct comprehensive financial analysis on a ticker.
 
         Args:
             ticker: Stock ticker symbol
+            stock_data: Previously fetched stock data; fetched here if omitted
 
         Returns:
             Dictionary containing financial analysis findings
         """
-        print(f"[{self.name}] Starting analysis for {ticker}...")
+        logger.info(f"[{self.name}] Starting analysis for {ticker}...")
 
-        # Fetch financial data
-        stock_data = self._fetch_stock_data(ticker)
+        # Fetch financial data unless the caller already has it
+        if stock_data is None:
+            stock_data = self._fetch_stock_data(ticker)
 
         if 'error' in stock_data:
             return {
@@ -51,20 +180,24 @@ class FinancialAnalystAgent:
                 'error': stock_data['error']
             }
 
-        # Analyze valuation
-        valuation_analysis = self._analyze_valuation(ticker, stock_data)
-
-        # Analyze financial health
-        health_analysis = self._analyze_financial_health(ticker, stock_data)
-
-        # Analyze growth metrics
-        growth_analysis = self._analyze_growth(ticker, stock_data)
-
-        # Analyze risk indicators
-        risk_analysis = self._analyze_risk_indicators(ticker, stock_data)
-
-        # Generate LLM-based insights
-        llm_insights = self._generate_insights(ticker, stock_data)
+        # Prose renderings of the data, formatted once and shared with the report
+        data_summary = format_financial_data(stock_data)
+        metric_analysis = format_metric_analysis(stock_data)
+
+        # The analyses are independent given stock_data; submit the LLM call
+        # first so its latency overlaps with the ratio computations
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            future_insights = executor.submit(self._generate_insights, ticker, data_summary, metric_analysis)
+            future_valuation = executor.submit(self._analyze_valuation, ticker, stock_data)
+            future_health = executor.submit(self._analyze_financial_health, ticker, stock_data)
+            future_growth = executor.submit(self._analyze_growth, ticker, stock_data)
+            future_risk = executor.submit(self._analyze_risk_indicators, ticker, stock_data)
+
+            valuation_analysis = future_valuation.result()
+            health_analysis = future_health.result()
+            growth_analysis = future_growth.result()
+            risk_analysis = future_risk.result()
+            llm_insights = future_insights.result()
 
         # Create comprehensive summary
         summary = self._create_summary(ticker, stock_data, valuation_analysis, health_analysis, growth_analysis, risk_analysis)
@@ -75,6 +208,8 @@ class FinancialAnalystAgent:
         findings = {
             'ticker': ticker,
             'stock_data': stock_data,
+            'data_summary': data_summary,
+            'metric_analysis': metric_analysis,
             'valuation_analysis': valuation_analysis,
             'health_analysis': health_analysis,
             'growth_analysis': growth_analysis,
@@ -83,17 +218,100 @@ class FinancialAnalystAgent:
             'summary': summary
         }
 
-        print(f"[{self.name}] Analysis completed for {ticker}")
+        logger.info(f"[{self.name}] Analysis completed for {ticker}")
         return findings
 
+    def analyze_batch(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Screen a list of tickers using the same classification rules as analyze().
+
+        Stock data is fetched in parallel and every metric is classified for all
+        tickers at once with NumPy. No LLM insights are generated and nothing is
+        written to vector memory, which keeps this suitable for portfolio scans.
+
+        Args:
+            tickers: Stock ticker symbols
+
+        Returns:
+            Dictionary mapping each ticker to its categories, or to an error
+        """
+        logger.info(f"[{self.name}] Starting batch screen for {len(tickers)} tickers...")
+
+        if not tickers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+            fetched = list(executor.map(self._fetch_stock_data, tickers))
+
+        valid_data = [data for data in fetched if 'error' not in data]
+
+        if not valid_data:
+            return {ticker: {'ticker': ticker, 'error': data['error']} for ticker, data in zip(tickers, fetched)}
+
+        def column(key: str, missing: float = 0.0) -> np.ndarray:
+            return np.array([
+                missing if data.get(key) is None else float(data[key]) for data in valid_data
+            ])
+
+        pe = column('pe_ratio')
+        debt = column('debt_to_equity')
+        current = column('current_ratio')
+        roe = column('roe')
+        revenue_growth = column('revenue_growth', missing=np.nan)
+        earnings_growth = column('earnings_growth', missing=np.nan)
+        volatility = column('volatility')
+        beta = column('beta')
+        year_change = np.array([
+            float(data.get('price_changes', {}).get('1_year') or 0) for data in valid_data
+        ])
+
+        # Average whichever growth figures are reported; NaN when neither is
+        growth = np.column_stack([revenue_growth, earnings_growth])
+        reported = np.count_nonzero(~np.isnan(growth), axis=1)
+        avg_growth = np.where(reported > 0, np.nansum(growth, axis=1) / np.maximum(reported, 1), np.nan)
+
+        volatility_code, beta_code, risk_code = _classify_risk(volatility, beta)
+
+        columns = {
+            'valuation_category': _digitize_labels(pe, _PE_THRESHOLDS, _PE_LABELS, pe > 0),
+            'debt_category': _digitize_labels(debt, _DEBT_THRESHOLDS, _DEBT_LABELS, debt >= 0),
+            'liquidity_category': _digitize_labels(current, _LIQUIDITY_THRESHOLDS, _LIQUIDITY_LABELS, current > 0),
+            'profitability_category': _digitize_labels(roe, _ROE_THRESHOLDS, _ROE_LABELS, roe > 0),
+            'growth_category': _digitize_labels(
+                avg_growth, _GROWTH_THRESHOLDS, _GROWTH_LABELS, ~np.isnan(avg_growth), right=True
+            ),
+            'momentum': _digitize_labels(year_change, _MOMENTUM_THRESHOLDS, _MOMENTUM_LABELS, right=True),
+            # Code -1 (unavailable) selects the trailing 'Unknown' entry
+            'volatility_category': np.asarray(_VOLATILITY_LABELS + ('Unknown',), dtype=object)[volatility_code],
+            'beta_category': np.asarray(_BETA_LABELS + ('Unknown',), dtype=object)[beta_code],
+            'risk_level': np.asarray(_RISK_LEVELS, dtype=object)[risk_code]
+        }
+
+        results = {}
+        row = 0
+        for ticker, data in zip(tickers, fetched):
+            if 'error' in data:
+                results[ticker] = {'ticker': ticker, 'error': data['error']}
+                continue
+
+            results[ticker] = {
+                'ticker': ticker,
+                'company_name': data.get('company_name', ticker),
+                **{key: str(values[row]) for key, values in columns.items()}
+            }
+            row += 1
+
+        logger.info(f"[{self.name}] Batch screen completed for {len(tickers)} tickers")
+        return results
+
     def _fetch_stock_data(self, ticker: str) -> Dict[str, Any]:
         """Fetch comprehensive stock data."""
-        print(f"[{self.name}] Fetching financial data for {ticker}...")
+        logger.info(f"[{self.name}] Fetching financial data for {ticker}...")
         return self.financial_client.get_stock_data(ticker)
 
     def _analyze_valuation(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze valuation metrics."""
-        print(f"[{self.name}] Analyzing valuation for {ticker}...")
+        logger.info(f"[{self.name}] Analyzing valuation for {ticker}...")
 
         pe_ratio = data.get('pe_ratio', 0)
         forward_pe = data.get('forward_pe', 0)
@@ -101,24 +319,10 @@ class FinancialAnalystAgent:
         price_to_book = data.get('price_to_book', 0)
 
         # Determine valuation category
-        valuation = 'Unknown'
-        if pe_ratio > 0:
-            if pe_ratio < 15:
-                valuation = 'Undervalued'
-            elif pe_ratio < 25:
-                valuation = 'Fairly Valued'
-            else:
-                valuation = 'Overvalued'
+        valuation = _PE_LABELS[bisect.bisect(_PE_THRESHOLDS, pe_ratio)] if pe_ratio > 0 else 'Unknown'
 
         # PEG ratio interpretation
-        peg_interpretation = 'Unknown'
-        if peg_ratio > 0:
-            if peg_ratio < 1:
-                peg_interpretation = 'Potentially undervalued relative to growth'
-            elif peg_ratio < 2:
-                peg_interpretation = 'Fairly valued relative to growth'
-            else:
-                peg_interpretation = 'Expensive relative to growth'
+        peg_interpretation = _PEG_LABELS[bisect.bisect(_PEG_THRESHOLDS, peg_ratio)] if peg_ratio > 0 else 'Unknown'
 
         analysis = {
             'pe_ratio': pe_ratio,
@@ -134,41 +338,20 @@ class FinancialAnalystAgent:
 
     def _analyze_financial_health(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze financial health metrics."""
-        print(f"[{self.name}] Analyzing financial health for {ticker}...")
+        logger.info(f"[{self.name}] Analyzing financial health for {ticker}...")
 
         debt_to_equity = data.get('debt_to_equity', 0)
         current_ratio = data.get('current_ratio', 0)
         roe = data.get('roe', 0)
 
         # Debt analysis
-        debt_category = 'Unknown'
-        if debt_to_equity >= 0:
-            if debt_to_equity < 0.5:
-                debt_category = 'Conservative (Low leverage)'
-            elif debt_to_equity < 1.0:
-                debt_category = 'Moderate leverage'
-            else:
-                debt_category = 'High leverage (Higher risk)'
+        debt_category = _DEBT_LABELS[bisect.bisect(_DEBT_THRESHOLDS, debt_to_equity)] if debt_to_equity >= 0 else 'Unknown'
 
         # Liquidity analysis
-        liquidity_category = 'Unknown'
-        if current_ratio > 0:
-            if current_ratio < 1.0:
-                liquidity_category = 'Poor (Potential liquidity issues)'
-            elif current_ratio < 2.0:
-                liquidity_category = 'Adequate'
-            else:
-                liquidity_category = 'Strong'
+        liquidity_category = _LIQUIDITY_LABELS[bisect.bisect(_LIQUIDITY_THRESHOLDS, current_ratio)] if current_ratio > 0 else 'Unknown'
 
         # Profitability analysis
-        profitability_category = 'Unknown'
-        if roe > 0:
-            if roe < 0.10:
-                profitability_category = 'Below average'
-            elif roe < 0.20:
-                profitability_category = 'Good'
-            else:
-                profitability_category = 'Excellent'
+        profitability_category = _ROE_LABELS[bisect.bisect(_ROE_THRESHOLDS, roe)] if roe > 0 else 'Unknown'
 
         analysis = {
             'debt_to_equity': debt_to_equity,
@@ -184,35 +367,23 @@ class FinancialAnalystAgent:
 
     def _analyze_growth(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze growth metrics."""
-        print(f"[{self.name}] Analyzing growth for {ticker}...")
+        logger.info(f"[{self.name}] Analyzing growth for {ticker}...")
 
-        revenue_growth = data.get('revenue_growth', 0)
-        earnings_growth = data.get('earnings_growth', 0)
+        revenue_growth = data.get('revenue_growth')
+        earnings_growth = data.get('earnings_growth')
         price_changes = data.get('price_changes', {})
 
-        # Growth category
-
-        avg_growth = (revenue_growth + earnings_growth) / 2 if revenue_growth and earnings_growth else 0
-        if avg_growth > 0.20:
-            growth_category = 'High growth'
-        elif avg_growth > 0.10:
-            growth_category = 'Moderate growth'
-        elif avg_growth > 0:
-            growth_category = 'Slow growth'
+        # Growth category, averaged over the figures that are reported (0 is a real value)
+        reported = [g for g in (revenue_growth, earnings_growth) if g is not None]
+        if reported:
+            avg_growth = sum(reported) / len(reported)
+            growth_category = _GROWTH_LABELS[bisect.bisect_left(_GROWTH_THRESHOLDS, avg_growth)]
         else:
-            growth_category = 'Negative growth'
+            growth_category = 'Unknown'
 
         # Price momentum
         year_change = price_changes.get('1_year', 0)
-
-        if year_change > 20:
-            momentum = 'Strong upward momentum'
-        elif year_change > 0:
-            momentum = 'Positive momentum'
-        elif year_change > -20:
-            momentum = 'Negative momentum'
-        else:
-            momentum = 'Strong downward momentum'
+        momentum = _MOMENTUM_LABELS[bisect.bisect_left(_MOMENTUM_THRESHOLDS, year_change)]
 
         analysis = {
             'revenue_growth': revenue_growth,
@@ -227,37 +398,16 @@ class FinancialAnalystAgent:
 
     def _analyze_risk_indicators(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze risk indicators."""
-        print(f"[{self.name}] Analyzing risk indicators for {ticker}...")
+        logger.info(f"[{self.name}] Analyzing risk indicators for {ticker}...")
 
         volatility = data.get('volatility', 0)
         beta = data.get('beta', 0)
 
-        # Volatility assessment
-        volatility_category = 'Unknown'
-        if volatility > 0:
-            if volatility < 20:
-                volatility_category = 'Low volatility (Stable)'
-            elif volatility < 40:
-                volatility_category = 'Moderate volatility'
-            else:
-                volatility_category = 'High volatility (Risky)'
-
-        # Beta assessment
-        beta_category = 'Unknown'
-        if beta > 0:
-            if beta < 0.8:
-                beta_category = 'Defensive (Less volatile than market)'
-            elif beta < 1.2:
-                beta_category = 'Market-correlated'
-            else:
-                beta_category = 'Aggressive (More volatile than market)'
-
-        # Overall risk level
-        risk_level = 'Medium'
-        if volatility > 40 or beta > 1.5:
-            risk_level = 'High'
-        elif volatility < 20 and beta < 0.8:
-            risk_level = 'Low'
+        volatility_code, beta_code, risk_code = (int(code) for code in _classify_risk(volatility, beta))
+
+        volatility_category = _VOLATILITY_LABELS[volatility_code] if volatility_code >= 0 else 'Unknown'
+        beta_category = _BETA_LABELS[beta_code] if beta_code >= 0 else 'Unknown'
+        risk_level = _RISK_LEVELS[risk_code]
 
         analysis = {
             'volatility': volatility,
@@ -270,45 +420,28 @@ class FinancialAnalystAgent:
 
         return analysis
 
-    def _generate_insights(self, ticker: str, data: Dict[str, Any]) -> str:
-        """Generate LLM-based insights from financial data."""
-        print(f"[{self.name}] Generating insights for {ticker}...")
-
-        # Prepare financial data context
-        data_summary = format_financial_data(data)
-        metric_analysis = format_metric_analysis(data)
-
-        prompt = f"""Analyze the following financial data for {ticker} and provide key insights:
-
-Financial Data:
-{data_summary}
+    def _generate_insights(self, ticker: str, data_summary: str, metric_analysis: str) -> str:
+        """Generate LLM-based insights from the formatted financial data."""
+        logger.info(f"[{self.name}] Generating insights for {ticker}...")
 
-Metric Analysis:
-{metric_analysis}
-
-Provide:
-1. 3-4 key strengths from a financial perspective
-2. 3-4 key concerns or weaknesses
-3. Overall financial assessment (2-3 sentences)
-
-Be concise and focus on the most important financial indicators.
-"""
+        prompt = _INSIGHTS_TEMPLATE.format(
+            ticker=ticker,
+            data_summary=data_summary,
+            metric_analysis=metric_analysis
+        )
 
         try:
-            response = self.client.chat.completions.create(
+            # Re-analysis of unchanged data produces an identical prompt
+            return cached_completion(
+                self.client,
                 model=self.settings.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are a quantitative financial analyst."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=[_INSIGHTS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 temperature=self.settings.temperature,
                 max_tokens=1000
             )
 
-            return response.choices[0].message.content
-
         except Exception as e:
-            print(f"[{self.name}] Error generating insights: {str(e)}")
+            logger.error(f"[{self.name}] Error generating insights: {str(e)}")
             return f"Error generating insights: {str(e)}"
 
     def _create_summary(
@@ -344,69 +477,54 @@ Be concise and focus on the most important financial indicators.
         summary: str
     ) -> None:
         """Store analysis findings in vector memory."""
-        print(f"[{self.name}] Storing findings in vector memory...")
+        logger.info(f"[{self.name}] Storing findings in vector memory...")
+
+        contents = [
+            summary,
+            f"Valuation Analysis:\n{valuation['summary']}",
+            f"Financial Health:\n{health['summary']}",
+            f"Growth Analysis:\n{growth['summary']}",
+            f"Risk Analysis:\n{risk['summary']}",
+            f"Financial Insights:\n{insights}"
+        ]
 
-        # Store summary
-        self.vector_store.add_document(
-            content=summary,
-            metadata={
+        metadatas = [
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'financial_summary'
-            }
-        )
-
-        # Store valuation analysis
-        self.vector_store.add_document(
-            content=f"Valuation Analysis:\n{valuation['summary']}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'valuation_analysis',
                 'valuation_category': valuation['valuation_category']
-            }
-        )
-
-        # Store financial health analysis
-        self.vector_store.add_document(
-            content=f"Financial Health:\n{health['summary']}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'health_analysis'
-            }
-        )
-
-        # Store growth analysis
-        self.vector_store.add_document(
-            content=f"Growth Analysis:\n{growth['summary']}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'growth_analysis',
                 'growth_category': growth['growth_category']
-            }
-        )
-
-        # Store risk analysis
-        self.vector_store.add_document(
-            content=f"Risk Analysis:\n{risk['summary']}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'risk_analysis',
                 'risk_level': risk['risk_level']
-            }
-        )
-
-        # Store LLM insights
-        self.vector_store.add_document(
-            content=f"Financial Insights:\n{insights}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'llm_insights'
             }
-        )
+        ]
+
+        # Single batched write: one embedding pass and one index update
+        self.vector_store.add_batch(contents, metadatas)
 
-        print(f"[{self.name}] Findings stored successfully")
+        logger.info(f"[{self.name}] Findings stored successfully")
@@ -3,13 +3,18 @@ Manager Agent - Multi-Agent Orchestration
 Coordinates all worker agents and manages the research workflow.
 """
 
-from typing import Dict, Any
+import logging
+from functools import cached_property
+from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from config.settings import get_settings
 from memory.vector_store import VectorStore
 from agents.researcher_agent import ResearcherAgent
 from agents.analyst_agent import FinancialAnalystAgent
 from agents.reporting_agent import ReportingAgent
+from utils.api_clients import FinancialAPIClient
+
+logger = logging.getLogger(__name__)
 
 
 class ManagerAgent:
@@ -24,14 +29,36 @@ class ManagerAgent:
         self.name = "ManagerAgent"
 
         # Initialize shared vector memory
-        self.vector_store = VectorStore()
+        self.vector_store = VectorStore.get_instance()
+
+        # Shared financial data client, reused across workflows
+        self.financial_client = FinancialAPIClient()
+
+        # Long-lived worker pool for the parallel research phase; the worker
+        # agents use blocking clients, so threads are reused across workflows
+        # instead of being spun up per request
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research")
+
+        logger.info(f"[{self.name}] Initialized")
 
-        # Initialize worker agents
-        self.researcher = ResearcherAgent(self.vector_store)
-        self.analyst = FinancialAnalystAgent(self.vector_store)
-        self.reporter = ReportingAgent(self.vector_store)
+    # Worker agents are created on first use, so a manager that only touches
+    # memory (e.g. clear_all_data) never sets up the search client or agents
+    # it doesn't need
 
-        print(f"[{self.name}] Initialized with all worker agents")
+    @cached_property
+    def researcher(self) -> ResearcherAgent:
+        """Researcher Agent, created on first access."""
+        return ResearcherAgent(self.vector_store)
+
+    @cached_property
+    def analyst(self) -> FinancialAnalystAgent:
+        """Financial Analyst Agent, created on first access."""
+        return FinancialAnalystAgent(self.vector_store)
+
+    @cached_property
+    def reporter(self) -> ReportingAgent:
+        """Reporting Agent, created on first access."""
+        return ReportingAgent(self.vector_store)
 
     def conduct_research(
         self,
@@ -50,36 +77,47 @@ class ManagerAgent:
         Returns:
             Dictionary containing complete research results and report
         """
-        print(f"\n{'='*60}")
-        print(f"[{self.name}] Starting research workflow for {ticker}")
-        print(f"[{self.name}] Investor Mode: {investor_mode}")
-        print(f"[{self.name}] Parallel Execution: {parallel}")
-        print(f"{'='*60}\n")
+        logger.info(f"[{self.name}] Starting research workflow for {ticker}")
+        logger.info(f"[{self.name}] Investor Mode: {investor_mode}")
+        logger.info(f"[{self.name}] Parallel Execution: {parallel}")
 
         # Clear previous data for this ticker
         self._clear_previous_data(ticker)
 
-        # Validate ticker first
-        validation_result = self._validate_ticker(ticker)
-        if not validation_result['valid']:
-            return {
-                'success': False,
-                'error': validation_result['error'],
-                'ticker': ticker
-            }
-
         try:
+            # Fetch stock data once; it validates the ticker and feeds the analyst
+            logger.info(f"[{self.name}] Validating ticker {ticker}...")
+            stock_data = self.financial_client.get_stock_data(ticker)
+
+            if 'error' in stock_data:
+                return {
+                    'success': False,
+                    'error': f"Invalid ticker or data unavailable: {stock_data['error']}",
+                    'ticker': ticker
+                }
+
+            if not stock_data.get('company_name') or stock_data.get('current_price', 0) == 0:
+                return {
+                    'success': False,
+                    'error': f"Ticker {ticker} found but has insufficient data",
+                    'ticker': ticker
+                }
+
+            logger.info(f"[{self.name}] Ticker {ticker} validated successfully")
+
+            company_name = stock_data['company_name']
+
             # Phase 1: Data gathering (Research + Analysis)
             if parallel:
-                research_findings, analyst_findings = self._execute_parallel_research(ticker)
+                research_findings, analyst_findings = self._execute_parallel_research(ticker, company_name, stock_data)
             else:
-                research_findings, analyst_findings = self._execute_sequential_research(ticker)
+                research_findings, analyst_findings = self._execute_sequential_research(ticker, company_name, stock_data)
 
             # Quality control check
             quality_check = self._quality_control(ticker, research_findings, analyst_findings)
             if not quality_check['passed']:
-                print(f"[{self.name}] Warning: Quality control issues detected")
-                print(f"[{self.name}] Issues: {quality_check['issues']}")
+                logger.warning(f"[{self.name}] Quality control issues detected")
+                logger.warning(f"[{self.name}] Issues: {quality_check['issues']}")
 
             # Phase 2: Report generation
             report = self._generate_report(ticker, research_findings, analyst_findings, investor_mode)
@@ -97,140 +135,142 @@ class ManagerAgent:
                 'final_validation': final_validation
             }
 
-            print(f"\n{'='*60}")
-            print(f"[{self.name}] Research workflow completed successfully for {ticker}")
-            print(f"{'='*60}\n")
+            logger.info(f"[{self.name}] Research workflow completed successfully for {ticker}")
 
             return result
 
         except Exception as e:
             error_msg = f"Error in research workflow: {str(e)}"
-            print(f"[{self.name}] {error_msg}")
+            logger.error(f"[{self.name}] {error_msg}")
             return {
                 'success': False,
                 'error': error_msg,
                 'ticker': ticker
             }
 
-    def _validate_ticker(self, ticker: str) -> Dict[str, Any]:
+    def conduct_research_batch(
+        self,
+        tickers: List[str],
+        investor_mode: str = "neutral",
+        max_concurrency: int = 4
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Validate that the ticker exists and can be analyzed.
+        Conduct research on several tickers concurrently.
+
+        Each ticker runs the full workflow on its own thread, with the
+        researcher and analyst executed sequentially inside it, so at most
+        max_concurrency workflows hit the APIs at once.
 
         Args:
-            ticker: Stock ticker symbol
+            tickers: Stock ticker symbols
+            investor_mode: Report tone ('neutral', 'bullish', 'bearish')
+            max_concurrency: Maximum number of tickers researched at once
 
         Returns:
-            Validation result with valid flag and error message if applicable
+            Dictionary mapping each ticker to its conduct_research() result
         """
-        print(f"[{self.name}] Validating ticker {ticker}...")
-
-        try:
-            # Try to fetch basic data using the analyst's client
-            from utils.api_clients import FinancialAPIClient
-            client = FinancialAPIClient()
-            data = client.get_stock_data(ticker)
-
-            if 'error' in data:
-                return {
-                    'valid': False,
-                    'error': f"Invalid ticker or data unavailable: {data['error']}"
-                }
-
-            if not data.get('company_name') or data.get('current_price', 0) == 0:
-                return {
-                    'valid': False,
-                    'error': f"Ticker {ticker} found but has insufficient data"
-                }
-
-            print(f"[{self.name}] Ticker {ticker} validated successfully")
-            return {
-                'valid': True,
-                'company_name': data.get('company_name', ticker)
-            }
-
-        except Exception as e:
-            return {
-                'valid': False,
-                'error': f"Ticker validation failed: {str(e)}"
-            }
+        logger.info(f"[{self.name}] Starting batch research for {len(tickers)} tickers")
+
+        if not tickers:
+            return {}
+
+        # Build the worker agents up front so concurrent workflows share them;
+        # first access to each cached_property creates and stores the agent
+        _ = self.researcher
+        _ = self.analyst
+        _ = self.reporter
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrency, len(tickers))),
+            thread_name_prefix="batch"
+        ) as executor:
+            results = executor.map(
+                lambda ticker: self.conduct_research(ticker, investor_mode=investor_mode, parallel=False),
+                tickers
+            )
+            return dict(zip(tickers, results))
 
     def _clear_previous_data(self, ticker: str) -> None:
         """Clear previous research data for the ticker."""
-        print(f"[{self.name}] Clearing previous data for {ticker}...")
+        logger.info(f"[{self.name}] Clearing previous data for {ticker}...")
         try:
             self.vector_store.clear_ticker(ticker)
-            print(f"[{self.name}] Previous data cleared")
+            logger.info(f"[{self.name}] Previous data cleared")
         except Exception as e:
-            print(f"[{self.name}] Warning: Could not clear previous data: {str(e)}")
+            logger.warning(f"[{self.name}] Could not clear previous data: {str(e)}")
 
-    def _execute_parallel_research(self, ticker: str) -> tuple:
+    def _execute_parallel_research(
+        self,
+        ticker: str,
+        company_name: str = "",
+        stock_data: Optional[Dict[str, Any]] = None
+    ) -> tuple:
         """
         Execute researcher and analyst in parallel.
 
         Args:
             ticker: Stock ticker symbol
+            company_name: Company name resolved during validation
+            stock_data: Stock data fetched during validation
 
         Returns:
             Tuple of (research_findings, analyst_findings)
         """
-        print(f"[{self.name}] Executing parallel research for {ticker}...")
+        logger.info(f"[{self.name}] Executing parallel research for {ticker}...")
 
-        research_findings = None
-        analyst_findings = None
+        results = {}
         errors = []
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both tasks
-            future_research = executor.submit(self._execute_researcher, ticker)
-            future_analyst = executor.submit(self._execute_analyst, ticker)
-
-            # Collect results
-            for future in as_completed([future_research, future_analyst]):
-                try:
-                    result = future.result()
-                    if future == future_research:
-                        research_findings = result
-                    else:
-                        analyst_findings = result
-                except Exception as e:
-                    errors.append(str(e))
-                    print(f"[{self.name}] Error in parallel execution: {str(e)}")
+        # Submit both tasks, keyed by the role each one fills
+        futures = {
+            self._executor.submit(self._execute_researcher, ticker, company_name): 'research',
+            self._executor.submit(self._execute_analyst, ticker, stock_data): 'analyst'
+        }
+
+        # Collect results
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                errors.append(str(e))
+                logger.error(f"[{self.name}] Error in parallel execution: {str(e)}")
 
         if errors:
-            print(f"[{self.name}] Completed with errors: {errors}")
+            logger.error(f"[{self.name}] Completed with errors: {errors}")
 
-        return research_findings, analyst_findings
+        return results.get('research'), results.get('analyst')
 
-    def _execute_sequential_research(self, ticker: str) -> tuple:
+    def _execute_sequential_research(
+        self,
+        ticker: str,
+        company_name: str = "",
+        stock_data: Optional[Dict[str, Any]] = None
+    ) -> tuple:
         """
         Execute researcher and analyst sequentially.
 
         Args:
             ticker: Stock ticker symbol
+            company_name: Company name resolved during validation
+            stock_data: Stock data fetched during validation
 
         Returns:
             Tuple of (research_findings, analyst_findings)
         """
-        print(f"[{self.name}] Executing sequential research for {ticker}...")
+        logger.info(f"[{self.name}] Executing sequential research for {ticker}...")
 
-        research_findings = self._execute_researcher(ticker)
-        analyst_findings = self._execute_analyst(ticker)
+        research_findings = self._execute_researcher(ticker, company_name)
+        analyst_findings = self._execute_analyst(ticker, stock_data)
 
         return research_findings, analyst_findings
 
-    def _execute_researcher(self, ticker: str) -> Dict[str, Any]:
+    def _execute_researcher(self, ticker: str, company_name: str = "") -> Dict[str, Any]:
         """Execute the Researcher Agent."""
-        print(f"[{self.name}] Delegating to Researcher Agent...")
+        logger.info(f"[{self.name}] Delegating to Researcher Agent...")
         try:
-            # Get company name from analyst data if available
-            from utils.api_clients import FinancialAPIClient
-            client = FinancialAPIClient()
-            data = client.get_stock_data(ticker)
-            company_name = data.get('company_name', '')
-
             return self.researcher.research(ticker, company_name)
         except Exception as e:
-            print(f"[{self.name}] Researcher Agent failed: {str(e)}")
+            logger.error(f"[{self.name}] Researcher Agent failed: {str(e)}")
             return {
                 'ticker': ticker,
                 'error': str(e),
@@ -239,13 +279,13 @@ class ManagerAgent:
                 'risk_analysis': {'risks': [], 'opportunities': []}
             }
 
-    def _execute_analyst(self, ticker: str) -> Dict[str, Any]:
+    def _execute_analyst(self, ticker: str, stock_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute the Financial Analyst Agent."""
-        print(f"[{self.name}] Delegating to Financial Analyst Agent...")
+        logger.info(f"[{self.name}] Delegating to Financial Analyst Agent...")
         try:
-            return self.analyst.analyze(ticker)
+            return self.analyst.analyze(ticker, stock_data)
         except Exception as e:
-            print(f"[{self.name}] Financial Analyst Agent failed: {str(e)}")
+            logger.error(f"[{self.name}] Financial Analyst Agent failed: {str(e)}")
             return {
                 'ticker': ticker,
                 'error': str(e)
@@ -259,11 +299,11 @@ class ManagerAgent:
         investor_mode: str
     ) -> Dict[str, Any]:
         """Generate the final report."""
-        print(f"[{self.name}] Delegating to Reporting Agent...")
+        logger.info(f"[{self.name}] Delegating to Reporting Agent...")
         try:
             return self.reporter.generate_report(ticker, research_findings, analyst_findings, investor_mode)
         except Exception as e:
-            print(f"[{self.name}] Reporting Agent failed: {str(e)}")
+            logger.error(f"[{self.name}] Reporting Agent failed: {str(e)}")
             return {
                 'ticker': ticker,
                 'error': str(e),
@@ -287,7 +327,7 @@ class ManagerAgent:
         Returns:
             Quality control result
         """
-        print(f"[{self.name}] Running quality control checks...")
+        logger.info(f"[{self.name}] Running quality control checks...")
 
         issues = []
 
@@ -328,9 +368,9 @@ class ManagerAgent:
         }
 
         if passed:
-            print(f"[{self.name}] Quality control passed")
+            logger.info(f"[{self.name}] Quality control passed")
         else:
-            print(f"[{self.name}] Quality control failed: {len(issues)} issue(s) found")
+            logger.warning(f"[{self.name}] Quality control failed: {len(issues)} issue(s) found")
 
         return result
 
@@ -344,7 +384,7 @@ class ManagerAgent:
         Returns:
             Validation result
         """
-        print(f"[{self.name}] Validating final report...")
+        logger.info(f"[{self.name}] Validating final report...")
 
         required_sections = [
             'executive_summary',
@@ -367,9 +407,9 @@ class ManagerAgent:
         }
 
         if valid:
-            print(f"[{self.name}] Report validation passed")
+            logger.info(f"[{self.name}] Report validation passed")
         else:
-            print(f"[{self.name}] Report validation failed")
+            logger.warning(f"[{self.name}] Report validation failed")
 
         return result
 
@@ -379,6 +419,10 @@ class ManagerAgent:
 
     def clear_all_data(self) -> None:
         """Clear all data from vector store."""
-        print(f"[{self.name}] Clearing all data from vector store...")
+        logger.info(f"[{self.name}] Clearing all data from vector store...")
         self.vector_store.clear_all()
-        print(f"[{self.name}] All data cleared")
+        logger.info(f"[{self.name}] All data cleared")
+
+    def shutdown(self) -> None:
+        """Release the worker thread pool."""
+        self._executor.shutdown(wait=True)
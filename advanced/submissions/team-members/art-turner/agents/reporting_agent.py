@@ -3,13 +3,160 @@ Reporting Agent - Synthesis & Formatting
 Creates comprehensive financial research reports from agent findings.
 """
 
-from typing import Dict, Any
-from datetime import datetime
-from openai import OpenAI
+import json
+import logging
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from config.settings import get_settings
+from utils.api_clients import get_openai_client
 from memory.vector_store import VectorStore
+from utils.llm_cache import cached_completion
 from utils.formatters import format_report
 
+logger = logging.getLogger(__name__)
+
+
+# System prompts carry all standing instructions and are identical for every
+# ticker, so requests share a common prefix; per-ticker data goes last, in the
+# user message.
+_NARRATIVE_SECTIONS = ('executive_summary', 'bull_case', 'bear_case', 'final_perspective')
+
+_NARRATIVE_SYSTEM_PROMPT = """You are a professional financial report writer.
+
+Using the company information provided by the user, write four sections of an investment research report in the requested tone. Return a JSON object with exactly these string keys:
+
+- "executive_summary": a concise executive summary (≤150 words) covering current market position, key financial metrics, overall sentiment and the primary investment consideration.
+- "bull_case": a compelling bull case (3-4 paragraphs) on growth potential, competitive advantages, positive catalysts and strong financial metrics. Be balanced but optimistic.
+- "bear_case": a thorough bear case (3-4 paragraphs) on potential headwinds, competitive threats, financial concerns and market risks. Be balanced but cautious.
+- "final_perspective": a balanced final perspective (2-3 paragraphs) summarizing the key points, who might find this investment suitable and what to watch for going forward.
+
+Keep every section professional. Separate paragraphs within a section with blank lines."""
+
+_EXECUTIVE_SUMMARY_SYSTEM_PROMPT = """You are a professional financial report writer.
+
+Write a concise executive summary (≤150 words) for the company described by the user, in the requested tone.
+
+Focus on:
+1. Current market position
+2. Key financial metrics
+3. Overall sentiment
+4. Primary investment consideration
+
+Keep it professional and concise."""
+
+_BULL_CASE_SYSTEM_PROMPT = """You are a financial analyst writing the bull case for an investment.
+
+Based on the information provided by the user, write a compelling bull case (3-4 paragraphs).
+
+Focus on:
+1. Growth potential
+2. Competitive advantages
+3. Positive catalysts
+4. Strong financial metrics
+
+Be balanced but optimistic."""
+
+_BEAR_CASE_SYSTEM_PROMPT = """You are a financial analyst writing the bear case for an investment.
+
+Based on the information provided by the user, write a thorough bear case (3-4 paragraphs).
+
+Focus on:
+1. Potential headwinds
+2. Competitive threats
+3. Financial concerns
+4. Market risks
+
+Be balanced but cautious."""
+
+_FINAL_PERSPECTIVE_SYSTEM_PROMPT = """You are a financial advisor providing a balanced perspective.
+
+Write a balanced final perspective (2-3 paragraphs) on the investment described by the user, in the requested report tone.
+
+Provide:
+1. Summary of key points
+2. Who might find this investment suitable
+3. What to watch for going forward
+
+Be professional and balanced."""
+
+
+# Template lines for the data-only report sections, formatted field by field
+# and joined once instead of building one large f-string per report.
+_SNAPSHOT_TEMPLATE = (
+    "**Company:** {company_name}",
+    "**Ticker:** {ticker}",
+    "**Sector:** {sector}",
+    "**Industry:** {industry}",
+    "**Market Cap:** ${market_cap:,.0f}",
+    "**Current Price:** ${current_price:.2f}",
+    "",
+    "**52-Week Range:** ${week_52_low:.2f} - ${week_52_high:.2f}",
+    "**Analyst Recommendation:** {recommendation}"
+)
+
+_TARGET_PRICE_LINE = "**Average Target Price:** ${target_price:.2f}"
+
+_INDICATORS_TEMPLATE = (
+    "### Price Performance",
+    "- **1 Day:** {change_1_day:+.2f}%",
+    "- **1 Week:** {change_1_week:+.2f}%",
+    "- **1 Month:** {change_1_month:+.2f}%",
+    "- **1 Year:** {change_1_year:+.2f}%",
+    "",
+    "### Valuation Metrics",
+    "- **P/E Ratio:** {pe_ratio:.2f} ({valuation_category})",
+    "- **Forward P/E:** {forward_pe:.2f}",
+    "- **PEG Ratio:** {peg_ratio:.2f}",
+    "- **Price to Book:** {price_to_book:.2f}",
+    "",
+    "### Financial Health",
+    "- **Debt to Equity:** {debt_to_equity:.2f} ({debt_category})",
+    "- **Current Ratio:** {current_ratio:.2f} ({liquidity_category})",
+    "- **ROE:** {roe:.2%} ({profitability_category})",
+    "",
+    "### Growth Metrics",
+    "- **Revenue Growth:** {revenue_growth:.2%}",
+    "- **Earnings Growth:** {earnings_growth:.2%}",
+    "- **EPS:** ${eps:.2f}",
+    "",
+    "### Risk Indicators",
+    "- **Volatility:** {volatility:.2f}% ({volatility_category})",
+    "- **Beta:** {beta:.2f} ({beta_category})",
+    "- **Overall Risk Level:** {risk_level}"
+)
+
+
+def _bullets(items: List[str], empty_message: str) -> str:
+    """Render items as a markdown bullet list, or empty_message if there are none."""
+    return "\n".join(f"- {item}" for item in items) if items else empty_message
+
+
+def _parse_narrative(content: str) -> Dict[str, str]:
+    """
+    Extract the narrative sections from a JSON-mode completion.
+
+    Args:
+        content: Raw completion text
+
+    Returns:
+        Dictionary of the non-empty sections found; empty if the JSON is invalid
+    """
+    try:
+        sections = json.loads(content)
+    except (TypeError, ValueError):
+        return {}
+
+    if not isinstance(sections, dict):
+        return {}
+
+    return {
+        section: sections[section].strip()
+        for section in _NARRATIVE_SECTIONS
+        if isinstance(sections.get(section), str) and sections[section].strip()
+    }
+
 
 class ReportingAgent:
     """
@@ -25,7 +172,7 @@ class ReportingAgent:
             vector_store: Shared vector memory for retrieving findings
         """
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.vector_store = vector_store
         self.name = "ReportingAgent"
 
@@ -48,46 +195,292 @@ class ReportingAgent:
         Returns:
             Dictionary containing the complete report
         """
-        print(f"[{self.name}] Generating report for {ticker}...")
+        report = None
+        for section, value in self.generate_report_stream(ticker, research_findings, analyst_findings, investor_mode):
+            if section == 'report':
+                report = value
+        return report
+
+    def generate_report_stream(
+        self,
+        ticker: str,
+        research_findings: Dict[str, Any],
+        analyst_findings: Dict[str, Any],
+        investor_mode: str = "neutral"
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate a report section by section.
+
+        Sections are yielded as (section_name, text) as soon as they are
+        ready, so a UI can render the template sections while the LLM-written
+        ones are still in flight. The last item is ('report', report), yielded
+        after the compiled report has been stored.
+
+        Args:
+            ticker: Stock ticker symbol
+            research_findings: Findings from Researcher Agent
+            analyst_findings: Findings from Financial Analyst Agent
+            investor_mode: Tone of the report ('neutral', 'bullish', 'bearish')
+
+        Yields:
+            (section_name, text) tuples, then ('report', report)
+        """
+        logger.info(f"[{self.name}] Generating report for {ticker}...")
+        return self._stream_report(ticker, research_findings, analyst_findings, investor_mode)
+
+    def generate_report_batched(
+        self,
+        tickers: List[str],
+        findings_by_ticker: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]],
+        investor_mode: str = "neutral",
+        batch_id: Optional[str] = None,
+        poll_interval: float = 60.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate reports for many tickers through the OpenAI Batch API.
+
+        Intended for offline runs: batch requests are billed at a discount
+        but may take up to 24 hours. The narrative request for every ticker
+        is submitted as one batch, which is polled until it finishes; the
+        rest of each report is then built as in generate_report().
+
+        Args:
+            tickers: Stock ticker symbols
+            findings_by_ticker: Maps each ticker to its
+                (research_findings, analyst_findings) tuple
+            investor_mode: Tone of the reports ('neutral', 'bullish', 'bearish')
+            batch_id: ID of a previously submitted batch to resume polling
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Dictionary mapping each ticker to its complete report
+        """
+        logger.info(f"[{self.name}] Generating batched reports for {len(tickers)} tickers...")
+
+        if batch_id is None:
+            lines = []
+            for ticker in tickers:
+                research, analysis = findings_by_ticker[ticker]
+                lines.append(json.dumps({
+                    'custom_id': f"{ticker}:narrative",
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': {
+                        'model': self.settings.openai_model,
+                        'messages': self._narrative_messages(ticker, research, analysis, investor_mode),
+                        'temperature': self.settings.temperature,
+                        'max_tokens': 2000,
+                        'response_format': {'type': 'json_object'}
+                    }
+                }))
+
+            input_file = self.client.files.create(
+                file=('reports.jsonl', '\n'.join(lines).encode('utf-8')),
+                purpose='batch'
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+            logger.info(f"[{self.name}] Submitted batch {batch.id}")
+        else:
+            batch = self.client.batches.retrieve(batch_id)
+
+        while batch.status in ('validating', 'in_progress', 'finalizing'):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        narratives: Dict[str, Dict[str, str]] = {}
+        if batch.status == 'completed' and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get('response') or {}
+                if record.get('error') or response.get('status_code') != 200:
+                    continue
+                ticker = record['custom_id'].rsplit(':', 1)[0]
+                narratives[ticker] = _parse_narrative(response['body']['choices'][0]['message']['content'])
+        else:
+            logger.error(f"[{self.name}] Batch {batch.id} ended with status {batch.status}")
+
+        # Sections missing from the batch output are generated in real time
+        reports = {}
+        for ticker in tickers:
+            research, analysis = findings_by_ticker[ticker]
+            for section, value in self._stream_report(
+                ticker, research, analysis, investor_mode, narratives.get(ticker, {})
+            ):
+                if section == 'report':
+                    reports[ticker] = value
+        return reports
+
+    def _stream_report(
+        self,
+        ticker: str,
+        research_findings: Dict[str, Any],
+        analyst_findings: Dict[str, Any],
+        investor_mode: str,
+        narrative: Optional[Dict[str, str]] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield report sections as they become available, then compile and
+        store the report.
+
+        Args:
+            narrative: Narrative sections already generated (e.g. by a batch);
+                when None they are requested here with one structured call
+        """
+        generated_date = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+        sections = {
+            'company_snapshot': self._generate_company_snapshot(ticker, analyst_findings),
+            'financial_indicators': self._generate_financial_indicators(ticker, analyst_findings),
+            'news_sentiment': self._generate_news_sentiment(ticker, research_findings)
+        }
+        yield from sections.items()
+
+        # The four LLM-written sections come from a single structured call
+        if narrative is None:
+            narrative = self._generate_narrative_sections(ticker, research_findings, analyst_findings, investor_mode)
+
+        for section in _NARRATIVE_SECTIONS:
+            if section in narrative:
+                sections[section] = narrative[section]
+                yield section, narrative[section]
+
+        # Any narrative section the structured call failed to produce is
+        # requested individually
+        missing = [section for section in _NARRATIVE_SECTIONS if section not in sections]
+        if missing:
+            for section, text in self._generate_sections_individually(
+                missing, ticker, research_findings, analyst_findings, investor_mode
+            ):
+                sections[section] = text
+                yield section, text
 
         # Retrieve additional context from vector memory
         context = self._retrieve_context(ticker)
 
-        # Generate report sections
-        executive_summary = self._generate_executive_summary(ticker, research_findings, analyst_findings, investor_mode)
-        company_snapshot = self._generate_company_snapshot(ticker, analyst_findings)
-        financial_indicators = self._generate_financial_indicators(ticker, analyst_findings)
-        news_sentiment = self._generate_news_sentiment(ticker, research_findings)
-        bull_case = self._generate_bull_case(ticker, research_findings, analyst_findings)
-        bear_case = self._generate_bear_case(ticker, research_findings, analyst_findings)
-        final_perspective = self._generate_final_perspective(ticker, research_findings, analyst_findings, investor_mode)
-
         # Compile report
         report = {
             'ticker': ticker,
-            'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'generated_date': generated_date,
             'investor_mode': investor_mode,
-            'executive_summary': executive_summary,
-            'company_snapshot': company_snapshot,
-            'financial_indicators': financial_indicators,
-            'news_sentiment': news_sentiment,
-            'bull_case': bull_case,
-            'bear_case': bear_case,
-            'final_perspective': final_perspective,
+            'executive_summary': sections['executive_summary'],
+            'company_snapshot': sections['company_snapshot'],
+            'financial_indicators': sections['financial_indicators'],
+            'news_sentiment': sections['news_sentiment'],
+            'bull_case': sections['bull_case'],
+            'bear_case': sections['bear_case'],
+            'final_perspective': sections['final_perspective'],
             'context_used': context
         }
 
         # Store report in vector memory
         self._store_report(ticker, report)
 
-        print(f"[{self.name}] Report generated successfully for {ticker}")
-        return report
+        logger.info(f"[{self.name}] Report generated successfully for {ticker}")
+        yield 'report', report
 
     def _retrieve_context(self, ticker: str) -> str:
         """Retrieve all relevant context from vector memory."""
-        print(f"[{self.name}] Retrieving context from vector memory...")
+        logger.info(f"[{self.name}] Retrieving context from vector memory...")
         return self.vector_store.get_context(ticker)
 
+    def _generate_narrative_sections(
+        self,
+        ticker: str,
+        research: Dict[str, Any],
+        analysis: Dict[str, Any],
+        mode: str
+    ) -> Dict[str, str]:
+        """
+        Generate the executive summary, bull case, bear case and final
+        perspective with one JSON-mode request.
+
+        Returns:
+            Dictionary of the sections that were produced; empty on failure
+        """
+        logger.info(f"[{self.name}] Generating narrative sections...")
+
+        try:
+            content = cached_completion(
+                self.client,
+                model=self.settings.openai_model,
+                messages=self._narrative_messages(ticker, research, analysis, mode),
+                temperature=self.settings.temperature,
+                max_tokens=2000,
+                response_format={"type": "json_object"}
+            )
+
+        except Exception as e:
+            logger.error(f"[{self.name}] Error generating narrative sections: {str(e)}")
+            return {}
+
+        return _parse_narrative(content)
+
+    def _narrative_messages(
+        self,
+        ticker: str,
+        research: Dict[str, Any],
+        analysis: Dict[str, Any],
+        mode: str
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for the combined narrative request."""
+        stock_data = analysis.get('stock_data', {})
+        sentiment = research.get('sentiment_analysis', {})
+        risk_analysis = research.get('risk_analysis', {})
+        opportunities = risk_analysis.get('opportunities', [])
+        risks = risk_analysis.get('risks', [])
+
+        prompt = f"""Tone: {mode}
+
+Company: {stock_data.get('company_name', ticker)} ({ticker})
+Current Price: ${stock_data.get('current_price', 0):.2f}
+Market Sentiment: {sentiment.get('overall_sentiment', 'neutral')}
+Valuation: {analysis.get('valuation_analysis', {}).get('valuation_category', 'Unknown')}
+Growth: {analysis.get('growth_analysis', {}).get('growth_category', 'Unknown')}
+Risk Level: {analysis.get('risk_analysis', {}).get('risk_level', 'Unknown')}
+
+Identified Opportunities:
+{_bullets(opportunities, "No specific opportunities identified")}
+
+Identified Risks:
+{_bullets(risks, "No specific risks identified")}
+
+Financial Insights:
+{analysis.get('llm_insights', '')}
+"""
+
+        return [
+            {"role": "system", "content": _NARRATIVE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _generate_sections_individually(
+        self,
+        sections: List[str],
+        ticker: str,
+        research: Dict[str, Any],
+        analysis: Dict[str, Any],
+        mode: str
+    ) -> Iterator[Tuple[str, str]]:
+        """Generate the given narrative sections concurrently, yielding each as it completes."""
+        generators = {
+            'executive_summary': lambda: self._generate_executive_summary(ticker, research, analysis, mode),
+            'bull_case': lambda: self._generate_bull_case(ticker, research, analysis),
+            'bear_case': lambda: self._generate_bear_case(ticker, research, analysis),
+            'final_perspective': lambda: self._generate_final_perspective(ticker, research, analysis, mode)
+        }
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {executor.submit(generators[section]): section for section in sections}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def _generate_executive_summary(
         self,
         ticker: str,
@@ -96,113 +489,105 @@ class ReportingAgent:
         mode: str
     ) -> str:
         """Generate executive summary (≤150 words)."""
-        print(f"[{self.name}] Generating executive summary...")
+        logger.info(f"[{self.name}] Generating executive summary...")
 
         stock_data = analysis.get('stock_data', {})
         company_name = stock_data.get('company_name', ticker)
         current_price = stock_data.get('current_price', 0)
         sentiment = research.get('sentiment_analysis', {})
 
-        prompt = f"""Write a concise executive summary (≤150 words) for {company_name} ({ticker}).
+        prompt = f"""Tone: {mode}
 
+Company: {company_name} ({ticker})
 Current Price: ${current_price:.2f}
 Market Sentiment: {sentiment.get('overall_sentiment', 'neutral')}
 Valuation: {analysis.get('valuation_analysis', {}).get('valuation_category', 'Unknown')}
 Growth: {analysis.get('growth_analysis', {}).get('growth_category', 'Unknown')}
 Risk Level: {analysis.get('risk_analysis', {}).get('risk_level', 'Unknown')}
-
-Tone: {mode}
-
-Focus on:
-1. Current market position
-2. Key financial metrics
-3. Overall sentiment
-4. Primary investment consideration
-
-Keep it professional and concise.
 """
 
         try:
-            response = self.client.chat.completions.create(
+            return cached_completion(
+                self.client,
                 model=self.settings.openai_model,
                 messages=[
-                    {"role": "system", "content": "You are a professional financial report writer."},
+                    {"role": "system", "content": _EXECUTIVE_SUMMARY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.settings.temperature,
                 max_tokens=300
             )
 
-            return response.choices[0].message.content
-
         except Exception as e:
-            print(f"[{self.name}] Error generating executive summary: {str(e)}")
+            logger.error(f"[{self.name}] Error generating executive summary: {str(e)}")
             return f"Error generating summary: {str(e)}"
 
     def _generate_company_snapshot(self, ticker: str, analysis: Dict[str, Any]) -> str:
         """Generate company snapshot section."""
-        print(f"[{self.name}] Generating company snapshot...")
+        logger.info(f"[{self.name}] Generating company snapshot...")
 
         stock_data = analysis.get('stock_data', {})
 
-        snapshot = f"""**Company:** {stock_data.get('company_name', ticker)}
-**Ticker:** {ticker}
-**Sector:** {stock_data.get('sector', 'N/A')}
-**Industry:** {stock_data.get('industry', 'N/A')}
-**Market Cap:** ${stock_data.get('market_cap', 0):,.0f}
-**Current Price:** ${stock_data.get('current_price', 0):.2f}
-
-**52-Week Range:** ${stock_data.get('52_week_low', 0):.2f} - ${stock_data.get('52_week_high', 0):.2f}
-**Analyst Recommendation:** {stock_data.get('analyst_recommendation', 'N/A').upper()}
-"""
+        fields = {
+            'company_name': stock_data.get('company_name', ticker),
+            'ticker': ticker,
+            'sector': stock_data.get('sector', 'N/A'),
+            'industry': stock_data.get('industry', 'N/A'),
+            'market_cap': stock_data.get('market_cap', 0),
+            'current_price': stock_data.get('current_price', 0),
+            'week_52_low': stock_data.get('52_week_low', 0),
+            'week_52_high': stock_data.get('52_week_high', 0),
+            'recommendation': stock_data.get('analyst_recommendation', 'N/A').upper(),
+            'target_price': stock_data.get('target_price', 0)
+        }
 
-        if stock_data.get('target_price', 0) > 0:
-            snapshot += f"**Average Target Price:** ${stock_data.get('target_price', 0):.2f}\n"
+        lines = [line.format_map(fields) for line in _SNAPSHOT_TEMPLATE]
+        if fields['target_price'] > 0:
+            lines.append(_TARGET_PRICE_LINE.format_map(fields))
 
-        return snapshot
+        return "\n".join(lines) + "\n"
 
     def _generate_financial_indicators(self, ticker: str, analysis: Dict[str, Any]) -> str:
         """Generate financial indicators section."""
-        print(f"[{self.name}] Generating financial indicators...")
+        logger.info(f"[{self.name}] Generating financial indicators...")
 
         stock_data = analysis.get('stock_data', {})
+        price_changes = stock_data.get('price_changes', {})
         valuation = analysis.get('valuation_analysis', {})
         health = analysis.get('health_analysis', {})
         risk = analysis.get('risk_analysis', {})
 
-        indicators = f"""### Price Performance
-- **1 Day:** {stock_data.get('price_changes', {}).get('1_day', 0):+.2f}%
-- **1 Week:** {stock_data.get('price_changes', {}).get('1_week', 0):+.2f}%
-- **1 Month:** {stock_data.get('price_changes', {}).get('1_month', 0):+.2f}%
-- **1 Year:** {stock_data.get('price_changes', {}).get('1_year', 0):+.2f}%
-
-### Valuation Metrics
-- **P/E Ratio:** {valuation.get('pe_ratio', 0):.2f} ({valuation.get('valuation_category', 'Unknown')})
-- **Forward P/E:** {valuation.get('forward_pe', 0):.2f}
-- **PEG Ratio:** {valuation.get('peg_ratio', 0):.2f}
-- **Price to Book:** {valuation.get('price_to_book', 0):.2f}
-
-### Financial Health
-- **Debt to Equity:** {health.get('debt_to_equity', 0):.2f} ({health.get('debt_category', 'Unknown')})
-- **Current Ratio:** {health.get('current_ratio', 0):.2f} ({health.get('liquidity_category', 'Unknown')})
-- **ROE:** {health.get('roe', 0):.2%} ({health.get('profitability_category', 'Unknown')})
-
-### Growth Metrics
-- **Revenue Growth:** {stock_data.get('revenue_growth', 0):.2%}
-- **Earnings Growth:** {stock_data.get('earnings_growth', 0):.2%}
-- **EPS:** ${stock_data.get('eps', 0):.2f}
-
-### Risk Indicators
-- **Volatility:** {risk.get('volatility', 0):.2f}% ({risk.get('volatility_category', 'Unknown')})
-- **Beta:** {risk.get('beta', 0):.2f} ({risk.get('beta_category', 'Unknown')})
-- **Overall Risk Level:** {risk.get('risk_level', 'Unknown')}
-"""
+        fields = {
+            'change_1_day': price_changes.get('1_day', 0),
+            'change_1_week': price_changes.get('1_week', 0),
+            'change_1_month': price_changes.get('1_month', 0),
+            'change_1_year': price_changes.get('1_year', 0),
+            'pe_ratio': valuation.get('pe_ratio', 0),
+            'valuation_category': valuation.get('valuation_category', 'Unknown'),
+            'forward_pe': valuation.get('forward_pe', 0),
+            'peg_ratio': valuation.get('peg_ratio', 0),
+            'price_to_book': valuation.get('price_to_book', 0),
+            'debt_to_equity': health.get('debt_to_equity', 0),
+            'debt_category': health.get('debt_category', 'Unknown'),
+            'current_ratio': health.get('current_ratio', 0),
+            'liquidity_category': health.get('liquidity_category', 'Unknown'),
+            'roe': health.get('roe', 0),
+            'profitability_category': health.get('profitability_category', 'Unknown'),
+            'revenue_growth': stock_data.get('revenue_growth') or 0,
+            'earnings_growth': stock_data.get('earnings_growth') or 0,
+            'eps': stock_data.get('eps', 0),
+            'volatility': risk.get('volatility', 0),
+            'volatility_category': risk.get('volatility_category', 'Unknown'),
+            'beta': risk.get('beta', 0),
+            'beta_category': risk.get('beta_category', 'Unknown'),
+            'risk_level': risk.get('risk_level', 'Unknown')
+        }
 
-        return indicators
+        return "\n".join(line.format_map(fields) for line in _INDICATORS_TEMPLATE) + "\n"
 
     def _generate_news_sentiment(self, ticker: str, research: Dict[str, Any]) -> str:
         """Generate news and sentiment section."""
-        print(f"[{self.name}] Generating news sentiment...")
+        logger.info(f"[{self.name}] Generating news sentiment...")
 
         sentiment = research.get('sentiment_analysis', {})
         news_articles = research.get('news_articles', [])
@@ -226,96 +611,66 @@ Keep it professional and concise.
 
     def _generate_bull_case(self, ticker: str, research: Dict[str, Any], analysis: Dict[str, Any]) -> str:
         """Generate bull case (opportunities) section."""
-        print(f"[{self.name}] Generating bull case...")
+        logger.info(f"[{self.name}] Generating bull case...")
 
         opportunities = research.get('risk_analysis', {}).get('opportunities', [])
         llm_insights = analysis.get('llm_insights', '')
 
-        prompt = f"""Based on the following information for {ticker}, write a compelling bull case (3-4 paragraphs):
+        prompt = f"""Ticker: {ticker}
 
 Identified Opportunities:
-{chr(10).join([f"- {o}" for o in opportunities]) if opportunities else "No specific opportunities identified"}
+{_bullets(opportunities, "No specific opportunities identified")}
 
 Financial Insights:
 {llm_insights}
-
-Focus on:
-1. Growth potential
-2. Competitive advantages
-3. Positive catalysts
-4. Strong financial metrics
-
-Be balanced but optimistic.
 """
 
         try:
-            response = self.client.chat.completions.create(
+            return cached_completion(
+                self.client,
                 model=self.settings.openai_model,
                 messages=[
-                    {"role": "system", "content": "You are a financial analyst writing the bull case for an investment."},
+                    {"role": "system", "content": _BULL_CASE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.settings.temperature,
                 max_tokens=600
             )
 
-            return response.choices[0].message.content
-
         except Exception as e:
-            print(f"[{self.name}] Error generating bull case: {str(e)}")
-            bull_case = "### Opportunities\n"
-            if opportunities:
-                for opp in opportunities:
-                    bull_case += f"- {opp}\n"
-            else:
-                bull_case += "Opportunities analysis not available.\n"
-            return bull_case
+            logger.error(f"[{self.name}] Error generating bull case: {str(e)}")
+            return "### Opportunities\n" + _bullets(opportunities, "Opportunities analysis not available.") + "\n"
 
     def _generate_bear_case(self, ticker: str, research: Dict[str, Any], analysis: Dict[str, Any]) -> str:
         """Generate bear case (risks) section."""
-        print(f"[{self.name}] Generating bear case...")
+        logger.info(f"[{self.name}] Generating bear case...")
 
         risks = research.get('risk_analysis', {}).get('risks', [])
         risk_level = analysis.get('risk_analysis', {}).get('risk_level', 'Unknown')
 
-        prompt = f"""Based on the following information for {ticker}, write a thorough bear case (3-4 paragraphs):
+        prompt = f"""Ticker: {ticker}
 
 Identified Risks:
-{chr(10).join([f"- {r}" for r in risks]) if risks else "No specific risks identified"}
+{_bullets(risks, "No specific risks identified")}
 
 Risk Level: {risk_level}
-
-Focus on:
-1. Potential headwinds
-2. Competitive threats
-3. Financial concerns
-4. Market risks
-
-Be balanced but cautious.
 """
 
         try:
-            response = self.client.chat.completions.create(
+            return cached_completion(
+                self.client,
                 model=self.settings.openai_model,
                 messages=[
-                    {"role": "system", "content": "You are a financial analyst writing the bear case for an investment."},
+                    {"role": "system", "content": _BEAR_CASE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.settings.temperature,
                 max_tokens=600
             )
 
-            return response.choices[0].message.content
-
         except Exception as e:
-            print(f"[{self.name}] Error generating bear case: {str(e)}")
-            bear_case = "### Risks\n"
-            if risks:
-                for risk in risks:
-                    bear_case += f"- {risk}\n"
-            else:
-                bear_case += "Risk analysis not available.\n"
-            return bear_case
+            logger.error(f"[{self.name}] Error generating bear case: {str(e)}")
+            return "### Risks\n" + _bullets(risks, "Risk analysis not available.") + "\n"
 
     def _generate_final_perspective(
         self,
@@ -325,47 +680,39 @@ Be balanced but cautious.
         mode: str
     ) -> str:
         """Generate final perspective section."""
-        print(f"[{self.name}] Generating final perspective...")
+        logger.info(f"[{self.name}] Generating final perspective...")
 
         valuation = analysis.get('valuation_analysis', {}).get('valuation_category', 'Unknown')
         sentiment = research.get('sentiment_analysis', {}).get('overall_sentiment', 'neutral')
         risk_level = analysis.get('risk_analysis', {}).get('risk_level', 'Unknown')
 
-        prompt = f"""Write a balanced final perspective (2-3 paragraphs) for {ticker}:
+        prompt = f"""Report Tone: {mode}
 
+Ticker: {ticker}
 Valuation: {valuation}
 Sentiment: {sentiment}
 Risk Level: {risk_level}
-Report Tone: {mode}
-
-Provide:
-1. Summary of key points
-2. Who might find this investment suitable
-3. What to watch for going forward
-
-Be professional and balanced.
 """
 
         try:
-            response = self.client.chat.completions.create(
+            return cached_completion(
+                self.client,
                 model=self.settings.openai_model,
                 messages=[
-                    {"role": "system", "content": "You are a financial advisor providing a balanced perspective."},
+                    {"role": "system", "content": _FINAL_PERSPECTIVE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.settings.temperature,
                 max_tokens=500
             )
 
-            return response.choices[0].message.content
-
         except Exception as e:
-            print(f"[{self.name}] Error generating final perspective: {str(e)}")
+            logger.error(f"[{self.name}] Error generating final perspective: {str(e)}")
             return f"Based on the analysis, {ticker} presents a {valuation.lower()} opportunity with {sentiment} market sentiment and {risk_level.lower()} risk. Further analysis recommended."
 
     def _store_report(self, ticker: str, report: Dict[str, Any]) -> None:
         """Store the complete report in vector memory."""
-        print(f"[{self.name}] Storing report in vector memory...")
+        logger.info(f"[{self.name}] Storing report in vector memory...")
 
         # Store full report
         report_text = format_report(report, format_type="markdown")
@@ -379,7 +726,7 @@ Be professional and balanced.
             }
         )
 
-        print(f"[{self.name}] Report stored successfully")
+        logger.info(f"[{self.name}] Report stored successfully")
 
     def export_report(self, report: Dict[str, Any], format_type: str = "markdown") -> str:
         """
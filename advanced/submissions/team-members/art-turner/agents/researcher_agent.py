@@ -3,14 +3,137 @@ Researcher Agent - Web & News Scraper
 Fetches market news, searches the web for sentiment and risks.
 """
 
+import json
+import logging
 import re
-from typing import Dict, Any, List
-from openai import OpenAI
+from typing import Dict, Any, List, Optional, Tuple
 from config.settings import get_settings
-from utils.api_clients import SearchAPIClient
+from utils.api_clients import SearchAPIClient, get_openai_client
 from utils.formatters import format_news_results
+from utils.llm_cache import cached_completion
 from memory.vector_store import VectorStore
 
+logger = logging.getLogger(__name__)
+
+_SENTIMENTS = ('bullish', 'neutral', 'bearish')
+
+# Field and section patterns for parsing free-text LLM responses, used when a
+# response is not the requested JSON
+_SENTIMENT_RE = re.compile(r'sentiment:(?P<value>[^\n]*)', re.IGNORECASE)
+_SCORE_RE = re.compile(r'score:[^\n]*?(?P<value>-?\d+)', re.IGNORECASE)
+_EXPLANATION_RE = re.compile(r'explanation:\s*(?P<value>.*?)(?:\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+_BULLET_RE = re.compile(r'^[ \t]*- (.+?)[ \t]*$', re.MULTILINE)
+
+
+# Standing instructions live in the system prompts so every ticker shares the
+# same request prefix; the news itself goes last, in the user message.
+_SENTIMENT_SYSTEM_PROMPT = """You are a financial analyst specializing in sentiment analysis.
+
+Analyze the sentiment of the news articles provided by the user.
+
+Provide:
+1. Overall sentiment (bullish/neutral/bearish)
+2. Sentiment score (-10 to +10, where -10 is very bearish and +10 is very bullish)
+3. Brief explanation (2-3 sentences) of the key factors driving sentiment
+
+Respond with a JSON object with these keys:
+- "sentiment": one of "bullish", "neutral", "bearish"
+- "score": integer from -10 to 10
+- "explanation": your explanation"""
+
+_RISK_SYSTEM_PROMPT = """You are a financial risk analyst.
+
+Based on the news articles provided by the user, identify:
+1. Key RISKS (potential negative factors)
+2. Key OPPORTUNITIES (potential positive factors)
+
+List 3-5 risks and 3-5 opportunities. Be specific and concise.
+
+Respond with a JSON object with these keys:
+- "risks": list of strings, one per risk
+- "opportunities": list of strings, one per opportunity"""
+
+
+def _load_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """Decode a JSON object from a completion, or return None if it is not one."""
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_sentiment(analysis: str) -> Tuple[str, int, str]:
+    """
+    Extract sentiment, score and explanation from a sentiment response.
+
+    Args:
+        analysis: Raw completion text, JSON or free text
+
+    Returns:
+        Tuple of (sentiment, score, explanation)
+    """
+    data = _load_json_object(analysis)
+    sentiment = str(data.get('sentiment', '')).strip().lower() if data is not None else ''
+    if sentiment in _SENTIMENTS:
+        try:
+            score = max(-10, min(10, int(data.get('score', 0))))
+        except (TypeError, ValueError):
+            score = 0
+        explanation = str(data.get('explanation') or '').strip()
+        return sentiment, score, explanation or analysis.strip()
+
+    # Free-text fallback; each field is optional and matched case-insensitively
+    sentiment = 'neutral'
+    score = 0
+    explanation = ''
+
+    sentiment_match = _SENTIMENT_RE.search(analysis)
+    if sentiment_match:
+        text_after = sentiment_match.group('value').lower()
+        if 'bullish' in text_after or 'positive' in text_after:
+            sentiment = 'bullish'
+        elif 'bearish' in text_after or 'negative' in text_after:
+            sentiment = 'bearish'
+
+    score_match = _SCORE_RE.search(analysis)
+    if score_match:
+        score = int(score_match.group('value'))
+
+    # Explanation runs until the first blank line
+    explanation_match = _EXPLANATION_RE.search(analysis)
+    if explanation_match:
+        explanation = explanation_match.group('value').strip()
+
+    # If no explanation found, use the whole analysis
+    return sentiment, score, explanation or analysis.strip()
+
+
+def _parse_risks(analysis: str) -> Tuple[List[str], List[str]]:
+    """
+    Extract risks and opportunities from a risk analysis response.
+
+    Args:
+        analysis: Raw completion text, JSON or free text
+
+    Returns:
+        Tuple of (risks, opportunities)
+    """
+    data = _load_json_object(analysis)
+    if data is not None and isinstance(data.get('risks'), list) and isinstance(data.get('opportunities'), list):
+        return (
+            [str(item).strip() for item in data['risks'] if str(item).strip()],
+            [str(item).strip() for item in data['opportunities'] if str(item).strip()]
+        )
+
+    # Free-text fallback: bullets after RISKS: up to OPPORTUNITIES:, then
+    # bullets after it
+    risks_block, _, opportunities_block = analysis.partition('OPPORTUNITIES:')
+    return (
+        _BULLET_RE.findall(risks_block.partition('RISKS:')[2]),
+        _BULLET_RE.findall(opportunities_block)
+    )
+
 
 class ResearcherAgent:
     """
@@ -26,7 +149,7 @@ class ResearcherAgent:
             vector_store: Shared vector memory for storing findings
         """
         self.settings = get_settings()
-        self.client = OpenAI(api_key=self.settings.openai_api_key)
+        self.client = get_openai_client()
         self.search_client = SearchAPIClient()
         self.vector_store = vector_store
         self.name = "ResearcherAgent"
@@ -42,7 +165,7 @@ class ResearcherAgent:
         Returns:
             Dictionary containing research findings
         """
-        print(f"[{self.name}] Starting research for {ticker}...")
+        logger.info(f"[{self.name}] Starting research for {ticker}...")
 
         # Gather news
         news_articles = self._gather_news(ticker, company_name)
@@ -67,12 +190,12 @@ class ResearcherAgent:
             'summary': summary
         }
 
-        print(f"[{self.name}] Research completed for {ticker}")
+        logger.info(f"[{self.name}] Research completed for {ticker}")
         return findings
 
     def _gather_news(self, ticker: str, company_name: str) -> List[Dict[str, Any]]:
         """Gather recent news articles about the ticker."""
-        print(f"[{self.name}] Gathering news for {ticker}...")
+        logger.info(f"[{self.name}] Gathering news for {ticker}...")
 
         search_query = f"{ticker} {company_name} stock news" if company_name else f"{ticker} stock news"
         news_articles = self.search_client.search_news(search_query, max_results=10)
@@ -81,7 +204,7 @@ class ResearcherAgent:
 
     def _analyze_sentiment(self, ticker: str, news_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze sentiment from news articles using LLM."""
-        print(f"[{self.name}] Analyzing sentiment for {ticker}...")
+        logger.info(f"[{self.name}] Analyzing sentiment for {ticker}...")
 
         if not news_articles:
             return {
@@ -93,75 +216,28 @@ class ResearcherAgent:
         # Prepare news context for LLM
         news_context = format_news_results(news_articles)
 
-        prompt = f"""Analyze the sentiment of the following news articles about {ticker}.
+        prompt = f"""Ticker: {ticker}
 
 News Articles:
 {news_context}
-
-Provide:
-1. Overall sentiment (bullish/neutral/bearish)
-2. Sentiment score (-10 to +10, where -10 is very bearish and +10 is very bullish)
-3. Brief explanation (2-3 sentences) of the key factors driving sentiment
-
-Format your response as:
-SENTIMENT: [bullish/neutral/bearish]
-SCORE: [number]
-EXPLANATION: [your explanation]
 """
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.settings.openai_model,
+            analysis = cached_completion(
+                self.client,
+                model=self.settings.openai_model_fast,
                 messages=[
-                    {"role": "system", "content": "You are a financial analyst specializing in sentiment analysis."},
+                    {"role": "system", "content": _SENTIMENT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=self.settings.temperature,
-                max_tokens=500
+                temperature=0,
+                max_tokens=500,
+                response_format={"type": "json_object"}
             )
 
-            analysis = response.choices[0].message.content
+            logger.debug(f"[{self.name}] Raw sentiment analysis response:\n{analysis}")
 
-            print(f"[{self.name}] Raw sentiment analysis response:\n{analysis}")
-
-            # Parse response - more flexible parsing
-            sentiment = 'neutral'
-            score = 0
-            explanation = ''
-
-            # Try to find sentiment
-            for keyword in ['SENTIMENT:', 'Sentiment:', 'sentiment:']:
-                if keyword in analysis:
-                    text_after = analysis.split(keyword, 1)[1].split('\n')[0].strip().lower()
-                    if 'bullish' in text_after or 'positive' in text_after:
-                        sentiment = 'bullish'
-                    elif 'bearish' in text_after or 'negative' in text_after:
-                        sentiment = 'bearish'
-                    else:
-                        sentiment = 'neutral'
-                    break
-
-            # Try to find score
-            for keyword in ['SCORE:', 'Score:', 'score:']:
-                if keyword in analysis:
-                    text_after = analysis.split(keyword, 1)[1].split('\n')[0].strip()
-                    # Extract first number found
-                    numbers = re.findall(r'-?\d+', text_after)
-                    if numbers:
-                        score = int(numbers[0])
-                    break
-
-            # Try to find explanation
-            for keyword in ['EXPLANATION:', 'Explanation:', 'explanation:']:
-                if keyword in analysis:
-                    explanation = analysis.split(keyword, 1)[1].strip()
-                    # Take everything after the keyword
-                    explanation = explanation.split('\n\n')[0]  # Stop at double newline
-                    break
-
-            # If no explanation found, use the whole analysis
-            if not explanation:
-                explanation = analysis.strip()
+            sentiment, score, explanation = _parse_sentiment(analysis)
 
             return {
                 'overall_sentiment': sentiment,
@@ -171,7 +247,7 @@ EXPLANATION: [your explanation]
             }
 
         except Exception as e:
-            print(f"[{self.name}] Error in sentiment analysis: {str(e)}")
+            logger.error(f"[{self.name}] Error in sentiment analysis: {str(e)}")
             return {
                 'overall_sentiment': 'neutral',
                 'sentiment_score': 0,
@@ -180,7 +256,7 @@ EXPLANATION: [your explanation]
 
     def _identify_risks(self, ticker: str, news_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Identify risks and opportunities from news."""
-        print(f"[{self.name}] Identifying risks for {ticker}...")
+        logger.info(f"[{self.name}] Identifying risks for {ticker}...")
 
         if not news_articles:
             return {
@@ -191,66 +267,36 @@ EXPLANATION: [your explanation]
 
         news_context = format_news_results(news_articles)
 
-        prompt = f"""Based on the following news articles about {ticker}, identify:
-1. Key RISKS (potential negative factors)
-2. Key OPPORTUNITIES (potential positive factors)
+        prompt = f"""Ticker: {ticker}
 
 News Articles:
 {news_context}
-
-List 3-5 risks and 3-5 opportunities. Be specific and concise.
-
-Format:
-RISKS:
-- [risk 1]
-- [risk 2]
-...
-
-OPPORTUNITIES:
-- [opportunity 1]
-- [opportunity 2]
-...
 """
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.settings.openai_model,
+            analysis = cached_completion(
+                self.client,
+                model=self.settings.openai_model_fast,
                 messages=[
-                    {"role": "system", "content": "You are a financial risk analyst."},
+                    {"role": "system", "content": _RISK_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=self.settings.temperature,
-                max_tokens=800
+                temperature=0,
+                max_tokens=800,
+                response_format={"type": "json_object"}
             )
 
-            analysis = response.choices[0].message.content
-
-            # Parse risks and opportunities
-            risks = []
-            opportunities = []
-            current_section = None
-
-            for line in analysis.strip().split('\n'):
-                line = line.strip()
-                if line.startswith('RISKS:'):
-                    current_section = 'risks'
-                elif line.startswith('OPPORTUNITIES:'):
-                    current_section = 'opportunities'
-                elif line.startswith('- '):
-                    item = line[2:].strip()
-                    if current_section == 'risks':
-                        risks.append(item)
-                    elif current_section == 'opportunities':
-                        opportunities.append(item)
+            risks, opportunities = _parse_risks(analysis)
 
             return {
                 'risks': risks,
                 'opportunities': opportunities,
-                'summary': analysis
+                'summary': "RISKS:\n" + "\n".join(f"- {r}" for r in risks)
+                           + "\n\nOPPORTUNITIES:\n" + "\n".join(f"- {o}" for o in opportunities)
             }
 
         except Exception as e:
-            print(f"[{self.name}] Error in risk analysis: {str(e)}")
+            logger.error(f"[{self.name}] Error in risk analysis: {str(e)}")
             return {
                 'risks': [],
                 'opportunities': [],
@@ -283,58 +329,55 @@ OPPORTUNITIES:
         summary: str
     ) -> None:
         """Store research findings in vector memory."""
-        print(f"[{self.name}] Storing findings in vector memory...")
+        # Without news the summary, sentiment and risk entries are only
+        # placeholders; storing them would just add noise to later queries
+        if not news_articles:
+            logger.info(f"[{self.name}] No news found, skipping vector memory write")
+            return
+
+        logger.info(f"[{self.name}] Storing findings in vector memory...")
 
-        # Store summary
-        self.vector_store.add_document(
-            content=summary,
-            metadata={
+        risks_text = "RISKS:\n" + "\n".join([f"- {r}" for r in risks['risks']])
+        opportunities_text = "OPPORTUNITIES:\n" + "\n".join([f"- {o}" for o in risks['opportunities']])
+
+        contents = [
+            summary,
+            f"Sentiment Analysis:\n{sentiment['explanation']}",
+            f"{risks_text}\n\n{opportunities_text}"
+        ]
+
+        metadatas = [
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'research_summary'
-            }
-        )
-
-        # Store sentiment analysis
-        self.vector_store.add_document(
-            content=f"Sentiment Analysis:\n{sentiment['explanation']}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'sentiment_analysis',
                 'sentiment': sentiment['overall_sentiment'],
                 'score': sentiment['sentiment_score']
-            }
-        )
-
-        # Store risks and opportunities
-        risks_text = "RISKS:\n" + "\n".join([f"- {r}" for r in risks['risks']])
-        opportunities_text = "OPPORTUNITIES:\n" + "\n".join([f"- {o}" for o in risks['opportunities']])
-
-        self.vector_store.add_document(
-            content=f"{risks_text}\n\n{opportunities_text}",
-            metadata={
+            },
+            {
                 'ticker': ticker,
                 'agent': self.name,
                 'type': 'risk_analysis'
             }
-        )
-
-        # Store individual news articles
-        if news_articles:
-            contents = []
-            metadatas = []
+        ]
 
-            for article in news_articles[:5]:  # Store top 5 articles
-                contents.append(f"{article['title']}\n{article['snippet']}")
-                metadatas.append({
-                    'ticker': ticker,
-                    'agent': self.name,
-                    'type': 'news_article',
-                    'url': article['url'],
-                    'date': article['published_date']
-                })
+        # Top 5 news articles
+        for article in news_articles[:5]:
+            contents.append(f"{article['title']}\n{article['snippet']}")
+            metadatas.append({
+                'ticker': ticker,
+                'agent': self.name,
+                'type': 'news_article',
+                'url': article['url'],
+                'date': article['published_date']
+            })
 
-            self.vector_store.add_batch(contents, metadatas)
+        # Single batched write: one embedding pass and one index update
+        self.vector_store.add_batch(contents, metadatas)
 
-        print(f"[{self.name}] Findings stored successfully")
+        logger.info(f"[{self.name}] Findings stored successfully")
@@ -5,6 +5,7 @@ Multi-agent financial research system with interactive UI.
 
 import gradio as gr
 import json
+import logging
 import os
 import tempfile
 from datetime import datetime
@@ -12,6 +13,12 @@ from agents.manager_agent import ManagerAgent
 from config.settings import get_settings
 
 
+# Agent progress is logged rather than printed; set LOG_LEVEL=INFO to see it
+logging.basicConfig(
+    level=get_settings().log_level.upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 # Initialize the Manager Agent
 manager = ManagerAgent()
 
@@ -3,40 +3,54 @@ Configuration settings for FinResearch AI system.
 Manages environment variables and application settings.
 """
 
-import os
+import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 
-class Settings(BaseModel):
-    """Application settings loaded from environment variables."""
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables and .env."""
+
+    # .env sits in the project root, found regardless of the working directory
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parent.parent / ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True
+    )
 
     # OpenAI Configuration
-    openai_api_key: str = Field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
-    openai_model: str = Field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"))
-    embedding_model: str = Field(default_factory=lambda: os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"))
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4-turbo-preview"
+    # Smaller model for structured classification/extraction calls
+    openai_model_fast: str = "gpt-4o-mini"
+    embedding_model: str = "text-embedding-3-small"
+    # Directory of an int8-quantized ONNX export of all-MiniLM-L6-v2; when
+    # unset the vector store embeds with sentence-transformers
+    embedding_onnx_path: Optional[str] = None
 
     # Search API Configuration
-    tavily_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("TAVILY_API_KEY"))
-    serpapi_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("SERPAPI_API_KEY"))
+    tavily_api_key: Optional[str] = None
+    serpapi_api_key: Optional[str] = None
 
     # Financial API Configuration
-    alphavantage_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("ALPHAVANTAGE_API_KEY"))
-    fmp_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("FMP_API_KEY"))
-    finnhub_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("FINNHUB_API_KEY"))
+    alphavantage_api_key: Optional[str] = None
+    fmp_api_key: Optional[str] = None
+    finnhub_api_key: Optional[str] = None
 
     # System Configuration
-    max_tokens: int = Field(default_factory=lambda: int(os.getenv("MAX_TOKENS", "4000")))
-    temperature: float = Field(default_factory=lambda: float(os.getenv("TEMPERATURE", "0.7")))
-    vector_db_path: str = Field(default_factory=lambda: os.getenv("VECTOR_DB_PATH", "./chroma_db"))
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    max_tokens: int = 4000
+    temperature: float = 0.7
+    vector_db_path: str = "./chroma_db"
+    # On-disk cache of financial data shared across restarts and workers;
+    # set FINANCIAL_CACHE_DIR to an empty value to disable it
+    financial_cache_dir: Optional[str] = "./.cache/financial"
+    financial_cache_ttl: int = 900
+    log_level: str = "WARNING"
 
     def validate_required_keys(self) -> None:
         """Validate that required API keys are present."""
@@ -44,20 +58,15 @@ class Settings(BaseModel):
             raise ValueError("OPENAI_API_KEY is required")
 
         if not self.tavily_api_key and not self.serpapi_api_key:
-            print("Warning: No search API key found. Using limited search capabilities.")
+            logger.warning("No search API key found. Using limited search capabilities.")
 
         if not self.alphavantage_api_key and not self.fmp_api_key and not self.finnhub_api_key:
-            print("Warning: No financial API key found. Will use yfinance (free, limited).")
-
-
-# Global settings instance
-_settings: Optional[Settings] = None
+            logger.warning("No financial API key found. Will use yfinance (free, limited).")
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        _settings.validate_required_keys()
-    return _settings
+    """Get the shared settings instance, creating it on first use."""
+    settings = Settings()
+    settings.validate_required_keys()
+    return settings
@@ -4,5 +4,7 @@ Handles vector database operations and shared memory for agents.
 """
 
 from .vector_store import VectorStore
+from .query_cache import QueryCache
+from .embeddings import QuantizedMiniLMEmbeddingFunction
 
-__all__ = ['VectorStore']
+__all__ = ['VectorStore', 'QueryCache', 'QuantizedMiniLMEmbeddingFunction']
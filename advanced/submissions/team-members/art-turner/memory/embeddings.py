@@ -0,0 +1,68 @@
+"""
+Embedding functions for the vector store.
+"""
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+
+class QuantizedMiniLMEmbeddingFunction(EmbeddingFunction):
+    """
+    all-MiniLM-L6-v2 embeddings from an int8-quantized ONNX export.
+
+    Produces the same mean-pooled, L2-normalized vectors as the
+    sentence-transformers model, but runs on ONNX Runtime instead of PyTorch.
+    The model is loaded from a local directory, not from Chroma's model cache.
+
+    Install the extra dependencies with `pip install -r requirements-onnx.txt`,
+    then export the model once with:
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 --optimize O2 ./minilm-onnx
+        optimum-cli onnxruntime quantize --avx512 --onnx_model ./minilm-onnx -o ./minilm-onnx-int8
+    """
+
+    def __init__(self, model_path: str, file_name: str = "model_quantized.onnx", max_length: int = 256):
+        """
+        Initialize the embedding function.
+
+        Args:
+            model_path: Directory containing the quantized model and tokenizer
+            file_name: ONNX file within model_path
+            max_length: Maximum tokens per document (MiniLM was trained on 256)
+        """
+        # Optional dependencies, only needed when the ONNX embedder is configured
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_path,
+            file_name=file_name,
+            provider="CPUExecutionProvider"
+        )
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """
+        Embed a batch of documents.
+
+        Args:
+            input: Texts to embed
+
+        Returns:
+            One embedding per text
+        """
+        encoded = self.tokenizer(
+            list(input),
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np"
+        )
+        token_embeddings = self.model(**encoded).last_hidden_state
+
+        # Mean-pool over real tokens, then L2-normalize
+        mask = encoded["attention_mask"][..., np.newaxis].astype(np.float32)
+        embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings.tolist()
@@ -0,0 +1,92 @@
+"""
+Query result caching for the vector store.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of vector store query results with a TTL.
+
+    Each entry may be tagged with the ticker it was computed for, so writes
+    for a ticker only invalidate the results that could have changed.
+    Untagged entries are dropped on every invalidation.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300):
+        """
+        Initialize the query cache.
+
+        Args:
+            max_size: Maximum number of results to keep
+            ttl: Seconds a result stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Optional[str], Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached result for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def set(self, key: Hashable, value: Any, ticker: Optional[str] = None) -> None:
+        """
+        Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Result to cache
+            ticker: Ticker the result depends on, if it is specific to one
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, ticker, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_ticker(self, ticker: Optional[str]) -> None:
+        """Drop results tagged with ticker, along with all untagged results."""
+        with self._lock:
+            stale = [key for key, (_, tag, _) in self._entries.items() if tag is None or tag == ticker]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, evictions and current size
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'size': len(self._entries)
+            }
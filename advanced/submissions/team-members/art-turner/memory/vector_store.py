@@ -6,8 +6,51 @@ import chromadb
 from chromadb.utils import embedding_functions
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import uuid
+from functools import lru_cache
+import hashlib
+import json
+import logging
+import threading
 from config.settings import get_settings
+from memory.embeddings import QuantizedMiniLMEmbeddingFunction
+from memory.query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+# Serializes model loading, so the warm-up thread and the first VectorStore
+# never load the model twice
+_embedding_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_client(path: str) -> Any:
+    """Get the ChromaDB client for a storage path, shared by all collections."""
+    return chromadb.PersistentClient(path=path)
+
+
+def _get_embedding_function(onnx_path: Optional[str]) -> Any:
+    """Get the embedding function, loading the model only once per process."""
+    with _embedding_lock:
+        return _load_embedding_function(onnx_path)
+
+
+def _embedding_model_name(onnx_path: Optional[str]) -> str:
+    """Name of the embedding model configured by onnx_path, recorded on collections."""
+    return "all-MiniLM-L6-v2-int8-onnx" if onnx_path else "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=None)
+def _load_embedding_function(onnx_path: Optional[str]) -> Any:
+    """Load the configured embedding function. Call through _get_embedding_function."""
+    if onnx_path:
+        # Quantized MiniLM on ONNX Runtime, loaded from a local export
+        # rather than Chroma's model cache
+        return QuantizedMiniLMEmbeddingFunction(onnx_path)
+
+    # Use sentence-transformers embedding function to avoid ONNX issues
+    return embedding_functions.SentenceTransformerEmbeddingFunction(
+        model_name="all-MiniLM-L6-v2"
+    )
 
 
 class VectorStore:
@@ -16,40 +59,100 @@ class VectorStore:
     Uses ChromaDB for efficient similarity search.
     """
 
-    def __init__(self, collection_name: str = "financial_research"):
+    # Documents per collection.add call when ingesting a batch
+    BATCH_SIZE = 128
+    # Records per collection.get page when scanning metadata
+    SCAN_PAGE_SIZE = 10000
+
+    # HNSW index settings, applied when a collection is created. Embeddings
+    # are normalized, so cosine ranks like L2. A larger M and construction_ef
+    # keep the graph well connected as findings accumulate. search_ef is
+    # raised from Chroma's default of 10, so queries explore more candidates:
+    # better recall for a small latency cost, which context retrieval can afford.
+    COLLECTION_METADATA = {
+        "description": "Financial research agent findings",
+        "hnsw:space": "cosine",
+        "hnsw:M": 32,
+        "hnsw:construction_ef": 200,
+        "hnsw:search_ef": 32
+    }
+
+    _instances: Dict[str, "VectorStore"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, collection_name: str = "financial_research") -> "VectorStore":
+        """
+        Get the shared vector store for a collection, creating it on first use.
+
+        Args:
+            collection_name: Name of the ChromaDB collection
+
+        Returns:
+            The process-wide VectorStore for that collection
+        """
+        instance = cls._instances.get(collection_name)
+        if instance is None:
+            with cls._instances_lock:
+                instance = cls._instances.get(collection_name)
+                if instance is None:
+                    instance = cls(collection_name)
+                    cls._instances[collection_name] = instance
+        return instance
+
+    def __init__(self, collection_name: str = "financial_research", batch_size: int = BATCH_SIZE):
         """
         Initialize the vector store.
 
         Args:
             collection_name: Name of the ChromaDB collection
+            batch_size: Documents per collection.add call in add_batch
         """
         self.settings = get_settings()
         self.collection_name = collection_name
+        self.batch_size = batch_size
 
-        # Initialize ChromaDB client with new API
-        self.client = chromadb.PersistentClient(
-            path=self.settings.vector_db_path
-        )
-
-        # Use sentence-transformers embedding function to avoid ONNX issues
-        self.embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name="all-MiniLM-L6-v2"
-        )
+        # Client and embedding model are shared by every store in the process
+        self.client = _get_client(self.settings.vector_db_path)
+        self.embedding_fn = _get_embedding_function(self.settings.embedding_onnx_path)
+        self.embedding_model = _embedding_model_name(self.settings.embedding_onnx_path)
 
         # Check if collection exists to avoid embedding function conflicts
         try:
-            # Try to get existing collection first
+            # Try to get existing collection first. Chroma does not persist
+            # the embedding function, so attach ours; otherwise documents
+            # would be embedded with Chroma's default model while queries
+            # use ours.
             self.collection = self.client.get_collection(
-                name=self.collection_name
+                name=self.collection_name,
+                embedding_function=self.embedding_fn
             )
         except Exception:
             # Collection doesn't exist, create it with embedding function
             self.collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"description": "Financial research agent findings"},
+                metadata={**self.COLLECTION_METADATA, "embedding_model": self.embedding_model},
                 embedding_function=self.embedding_fn
             )
 
+        # Stored vectors only match queries from the model that wrote them.
+        # Collections created before the model was recorded used MiniLM.
+        stored_model = (self.collection.metadata or {}).get("embedding_model", "all-MiniLM-L6-v2")
+        if stored_model != self.embedding_model:
+            logger.warning(
+                f"Collection '{self.collection_name}' was built with the {stored_model} "
+                f"embedding model, but {self.embedding_model} is configured. Existing "
+                f"findings will not match new queries; delete {self.settings.vector_db_path} "
+                f"or use a new collection name after switching models."
+            )
+
+        # Cached query results, invalidated by writes for the same ticker
+        self.query_cache = QueryCache(max_size=2000, ttl=300)
+
+        # Query text embeddings; these never go stale, so the cache is never
+        # invalidated and entries only leave by LRU eviction
+        self.embedding_cache = QueryCache(max_size=1024, ttl=float('inf'))
+
     def add_document(
         self,
         content: str,
@@ -62,25 +165,29 @@ class VectorStore:
         Args:
             content: Text content to store
             metadata: Metadata about the document (agent, ticker, timestamp, etc.)
-            document_id: Optional custom document ID
+            document_id: Optional custom document ID; defaults to a hash of
+                the ticker and content, so storing the same finding again
+                replaces it instead of duplicating it
 
         Returns:
             Document ID
         """
         if document_id is None:
-            document_id = str(uuid.uuid4())
+            document_id = self._content_id(content, metadata)
 
         # Add timestamp if not present
         if 'timestamp' not in metadata:
             metadata['timestamp'] = datetime.now().isoformat()
 
-        # Add to collection
-        self.collection.add(
+        # Insert or replace in one operation
+        self.collection.upsert(
             documents=[content],
             metadatas=[metadata],
             ids=[document_id]
         )
 
+        self.query_cache.invalidate_ticker(metadata.get('ticker'))
+
         return document_id
 
     def add_batch(
@@ -95,28 +202,67 @@ class VectorStore:
         Args:
             contents: List of text contents
             metadatas: List of metadata dictionaries
-            document_ids: Optional list of custom document IDs
+            document_ids: Optional list of custom document IDs; defaults to
+                content hashes as in add_document
 
         Returns:
             List of document IDs
         """
         if document_ids is None:
-            document_ids = [str(uuid.uuid4()) for _ in contents]
+            document_ids = [self._content_id(content, metadata) for content, metadata in zip(contents, metadatas)]
 
-        # Add timestamps
+        # Add timestamps; one timestamp covers the whole batch
+        now = datetime.now().isoformat()
         for metadata in metadatas:
-            if 'timestamp' not in metadata:
-                metadata['timestamp'] = datetime.now().isoformat()
-
-        # Add to collection
-        self.collection.add(
-            documents=contents,
-            metadatas=metadatas,
-            ids=document_ids
-        )
+            metadata.setdefault('timestamp', now)
+
+        # Chroma rejects repeated IDs within one call; the last copy wins
+        unique = {doc_id: (content, metadata) for doc_id, content, metadata in zip(document_ids, contents, metadatas)}
+        ids = list(unique)
+
+        # Upsert in chunks to bound embedding batch size and memory
+        for start in range(0, len(ids), self.batch_size):
+            chunk = ids[start:start + self.batch_size]
+            self.collection.upsert(
+                documents=[unique[doc_id][0] for doc_id in chunk],
+                metadatas=[unique[doc_id][1] for doc_id in chunk],
+                ids=chunk
+            )
+
+        for ticker in {metadata.get('ticker') for metadata in metadatas}:
+            self.query_cache.invalidate_ticker(ticker)
 
         return document_ids
 
+    def _embed(self, texts: List[str]) -> List[Any]:
+        """
+        Embed query texts, reusing cached embeddings.
+
+        Texts not seen before are embedded together in one call. Passing the
+        vectors as query_embeddings also means Chroma does not embed again.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            One embedding per text, in order
+        """
+        embeddings = {text: self.embedding_cache.get(text) for text in texts}
+        missing = [text for text, embedding in embeddings.items() if embedding is None]
+
+        if missing:
+            for text, embedding in zip(missing, self.embedding_fn(missing)):
+                self.embedding_cache.set(text, embedding)
+                embeddings[text] = embedding
+
+        return [embeddings[text] for text in texts]
+
+    @staticmethod
+    def _content_id(content: str, metadata: Dict[str, Any]) -> str:
+        """Derive a stable document ID from the document's ticker and content."""
+        key = f"{metadata.get('ticker', '')}\x00{content}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
     def query(
         self,
         query_text: str,
@@ -134,17 +280,74 @@ class VectorStore:
         Returns:
             Dictionary containing documents, metadatas, and distances
         """
-        results = self.collection.query(
-            query_texts=[query_text],
-            n_results=n_results,
-            where=filter_metadata
-        )
+        return self.batch_query([query_text], n_results, filter_metadata)[0]
 
-        return {
-            'documents': results['documents'][0] if results['documents'] else [],
-            'metadatas': results['metadatas'][0] if results['metadatas'] else [],
-            'distances': results['distances'][0] if results['distances'] else []
-        }
+    def batch_query(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the vector store for several texts at once.
+
+        Cached results are served directly; the remaining texts are embedded
+        and searched together in a single collection query.
+
+        Args:
+            query_texts: Texts to search for
+            n_results: Number of results to return per text
+            filter_metadata: Optional metadata filters applied to every text
+
+        Returns:
+            One dictionary of documents, metadatas, and distances per text,
+            in the order of query_texts
+        """
+        return self._cached_query(query_texts, n_results, filter_metadata)
+
+    def _cached_query(
+        self,
+        query_texts: List[str],
+        n_results: int,
+        where: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, List[Any]]]:
+        """
+        Run a query, serving repeated texts from the query cache.
+
+        Results are tagged with the ticker in a plain {"ticker": ...} filter so
+        writes for other tickers leave them cached; results from any other
+        filter are dropped on every write.
+
+        Returns:
+            One dictionary of documents, metadatas, and distances per text
+        """
+        where_key = json.dumps(where, sort_keys=True, default=str)
+        ticker = where.get('ticker') if where else None
+        ticker = ticker if isinstance(ticker, str) else None
+
+        cache_keys = [('query', text, n_results, where_key) for text in query_texts]
+        cached = [self.query_cache.get(key) for key in cache_keys]
+
+        # Deduplicate misses so a text repeated in one call is embedded once
+        misses = list(dict.fromkeys(text for text, hit in zip(query_texts, cached) if hit is None))
+        if misses:
+            results = self.collection.query(
+                query_embeddings=self._embed(misses),
+                n_results=n_results,
+                where=where
+            )
+            fetched = {}
+            for i, text in enumerate(misses):
+                fetched[text] = {
+                    'documents': results['documents'][i] if results['documents'] else [],
+                    'metadatas': results['metadatas'][i] if results['metadatas'] else [],
+                    'distances': results['distances'][i] if results['distances'] else []
+                }
+                self.query_cache.set(('query', text, n_results, where_key), fetched[text], ticker=ticker)
+            cached = [hit if hit is not None else fetched[text] for text, hit in zip(query_texts, cached)]
+
+        # Copy the lists so callers can't modify the cached entries
+        return [{key: list(values) for key, values in result.items()} for result in cached]
 
     def get_by_ticker(self, ticker: str, n_results: int = 10) -> Dict[str, Any]:
         """
@@ -157,16 +360,7 @@ class VectorStore:
         Returns:
             Dictionary containing documents and metadatas
         """
-        results = self.collection.query(
-            query_texts=[ticker],
-            n_results=n_results,
-            where={"ticker": ticker}
-        )
-
-        return {
-            'documents': results['documents'][0] if results['documents'] else [],
-            'metadatas': results['metadatas'][0] if results['metadatas'] else []
-        }
+        return self._cached_get({"ticker": ticker}, n_results, ticker=ticker)
 
     def get_by_agent(self, agent_name: str, n_results: int = 10) -> Dict[str, Any]:
         """
@@ -179,16 +373,45 @@ class VectorStore:
         Returns:
             Dictionary containing documents and metadatas
         """
-        results = self.collection.query(
-            query_texts=[agent_name],
-            n_results=n_results,
-            where={"agent": agent_name}
-        )
+        return self._cached_get({"agent": agent_name}, n_results)
 
-        return {
-            'documents': results['documents'][0] if results['documents'] else [],
-            'metadatas': results['metadatas'][0] if results['metadatas'] else []
-        }
+    def _cached_get(
+        self,
+        where: Dict[str, Any],
+        limit: int,
+        ticker: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Fetch documents by metadata alone, serving repeats from the query cache.
+
+        This is a plain metadata lookup, so nothing is embedded and no
+        similarity search runs.
+
+        Args:
+            where: Metadata filter
+            limit: Maximum number of documents
+            ticker: Ticker the result depends on, if it is specific to one
+
+        Returns:
+            Dictionary containing documents and metadatas
+        """
+        cache_key = ('get', json.dumps(where, sort_keys=True, default=str), limit)
+        cached = self.query_cache.get(cache_key)
+
+        if cached is None:
+            results = self.collection.get(
+                where=where,
+                limit=limit,
+                include=["documents", "metadatas"]
+            )
+            cached = {
+                'documents': results.get('documents') or [],
+                'metadatas': results.get('metadatas') or []
+            }
+            self.query_cache.set(cache_key, cached, ticker=ticker)
+
+        # Copy the lists so callers can't modify the cached entry
+        return {key: list(values) for key, values in cached.items()}
 
     def clear_ticker(self, ticker: str) -> None:
         """
@@ -205,14 +428,20 @@ class VectorStore:
         if results['ids']:
             self.collection.delete(ids=results['ids'])
 
+        self.query_cache.invalidate_ticker(ticker)
+
     def clear_all(self) -> None:
         """Clear all documents from the vector store."""
-        self.client.delete_collection(name=self.collection_name)
-        self.collection = self.client.create_collection(
-            name=self.collection_name,
-            metadata={"description": "Financial research agent findings"},
-            embedding_function=self.embedding_fn
-        )
+        # Delete by ID rather than dropping the collection, so the collection
+        # handle and its index stay live. Each page is deleted before the
+        # next is read, so the offset is always 0.
+        while True:
+            page = self.collection.get(include=[], limit=self.SCAN_PAGE_SIZE)
+            if not page['ids']:
+                break
+            self.collection.delete(ids=page['ids'])
+
+        self.query_cache.clear()
 
     def get_context(self, ticker: str, agent: Optional[str] = None) -> str:
         """
@@ -225,26 +454,31 @@ class VectorStore:
         Returns:
             Formatted context string
         """
+        cache_key = ('context', ticker, agent)
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         filter_dict = {"ticker": ticker}
         if agent:
             filter_dict["agent"] = agent
 
         results = self.collection.query(
-            query_texts=[ticker],
+            query_embeddings=self._embed([ticker]),
             n_results=20,
             where=filter_dict
         )
 
         if not results['documents'] or not results['documents'][0]:
-            return f"No context found for {ticker}"
-
-        context_parts = []
-        for doc, metadata in zip(results['documents'][0], results['metadatas'][0]):
-            agent_name = metadata.get('agent', 'Unknown')
-            timestamp = metadata.get('timestamp', 'Unknown')
-            context_parts.append(f"[{agent_name} - {timestamp}]\n{doc}\n")
+            context = f"No context found for {ticker}"
+        else:
+            context = "\n---\n".join(
+                f"[{metadata.get('agent', 'Unknown')} - {metadata.get('timestamp', 'Unknown')}]\n{doc}\n"
+                for doc, metadata in zip(results['documents'][0], results['metadatas'][0])
+            )
 
-        return "\n---\n".join(context_parts)
+        self.query_cache.set(cache_key, context, ticker=ticker)
+        return context
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -255,22 +489,52 @@ class VectorStore:
         """
         count = self.collection.count()
 
-        # Get unique tickers and agents
-        all_data = self.collection.get()
-        metadatas = all_data.get('metadatas', [])
-
+        # Get unique tickers and agents, reading metadata only, page by page
         tickers = set()
         agents = set()
-        for metadata in metadatas:
-            if 'ticker' in metadata:
-                tickers.add(metadata['ticker'])
-            if 'agent' in metadata:
-                agents.add(metadata['agent'])
+        offset = 0
+        while True:
+            page = self.collection.get(include=["metadatas"], limit=self.SCAN_PAGE_SIZE, offset=offset)
+            metadatas = page.get('metadatas') or []
+            for metadata in metadatas:
+                if 'ticker' in metadata:
+                    tickers.add(metadata['ticker'])
+                if 'agent' in metadata:
+                    agents.add(metadata['agent'])
+            if len(metadatas) < self.SCAN_PAGE_SIZE:
+                break
+            offset += self.SCAN_PAGE_SIZE
 
         return {
             'total_documents': count,
             'unique_tickers': len(tickers),
             'unique_agents': len(agents),
             'tickers': list(tickers),
-            'agents': list(agents)
+            'agents': list(agents),
+            'query_cache': self.query_cache.get_statistics()
         }
+
+
+def prewarm_embeddings() -> threading.Thread:
+    """
+    Load the embedding model and run one embedding on a background thread.
+
+    This moves the model load and first-inference cost off the first agent
+    request. Failures are logged; the model is then loaded on first use.
+
+    Returns:
+        The started daemon thread
+    """
+    def warm() -> None:
+        try:
+            _get_embedding_function(get_settings().embedding_onnx_path)(["warmup"])
+            logger.info("Embedding model warmed up")
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed: {str(e)}")
+
+    thread = threading.Thread(target=warm, name="embedding-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+prewarm_embeddings()
@@ -3,12 +3,17 @@ Utilities Module
 Helper functions and utilities for the financial research system.
 """
 
-from .api_clients import FinancialAPIClient, SearchAPIClient
+from .api_clients import FinancialAPIClient, SearchAPIClient, get_openai_client
 from .formatters import format_financial_data, format_report
+from .llm_cache import ResponseCache, get_response_cache, cached_completion
 
 __all__ = [
     'FinancialAPIClient',
     'SearchAPIClient',
+    'get_openai_client',
     'format_financial_data',
-    'format_report'
+    'format_report',
+    'ResponseCache',
+    'get_response_cache',
+    'cached_completion'
 ]
@@ -3,43 +3,228 @@ API Client utilities for financial data and web search.
 """
 
 
-from typing import List, Dict, Any
+import copy
+import logging
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
 import yfinance as yf
+from diskcache import Cache
+from openai import OpenAI
 from datetime import datetime
 from config.settings import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Price history to fetch for each supported horizon, with the price changes
+# it covers: (change name, index into the close history, history length the
+# index needs). Index 0 is the start of the fetched window, so a change
+# spanning the whole horizon uses it.
+_HORIZONS: Dict[str, Tuple[str, Tuple[Tuple[str, int, int], ...]]] = {
+    '1mo': ('1mo', (('1_day', -2, 2), ('1_week', -5, 6), ('1_month', 0, 1))),
+    '3mo': ('3mo', (('1_day', -2, 2), ('1_week', -5, 6), ('1_month', -21, 22))),
+    '6mo': ('6mo', (('1_day', -2, 2), ('1_week', -5, 6), ('1_month', -21, 22))),
+    '1y': ('1y', (('1_day', -2, 2), ('1_week', -5, 6), ('1_month', -21, 22), ('1_year', 0, 1)))
+}
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Get the OpenAI client shared by all agents.
+
+    One client means one connection pool, so concurrent section and agent
+    requests reuse keep-alive connections instead of each agent opening its own.
+    SDK retries are disabled because utils.llm_cache retries completions
+    itself; stacking both would multiply requests on every transient error.
+    """
+    return OpenAI(api_key=get_settings().openai_api_key, max_retries=0)
+
+
+@lru_cache(maxsize=1)
+def get_disk_cache() -> Optional[Cache]:
+    """
+    Get the on-disk financial data cache, or None if it is disabled.
+
+    The cache is SQLite-backed and safe to share between threads and
+    processes, so restarts and multiple app workers reuse fetched data.
+    """
+    directory = get_settings().financial_cache_dir
+    if not directory:
+        return None
+
+    try:
+        return Cache(directory)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Disk cache at {directory} unavailable, using memory only: {e}")
+        return None
+
 
 class FinancialAPIClient:
     """Client for fetching financial data from various sources."""
 
+    # yfinance results are cached across all client instances so that
+    # back-to-back validations and analyses of a ticker share one upstream
+    # fetch. Statements change at most quarterly, so they are kept longer.
+    # Behind this in-memory cache sits the on-disk cache (get_disk_cache),
+    # whose entries last financial_cache_ttl seconds.
+    CACHE_TTL_SECONDS = 60
+    STATEMENTS_CACHE_TTL_SECONDS = 300
+    CACHE_MAX_SIZE = 1024
+    _cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+    _cache_lock = threading.RLock()
+
     def __init__(self):
         self.settings = get_settings()
 
-    def get_stock_data(self, ticker: str) -> Dict[str, Any]:
+    def get_stock_data(self, ticker: str, horizon: str = "1y") -> Dict[str, Any]:
         """
         Fetch comprehensive stock data for a given ticker.
 
+        Successful results are cached for CACHE_TTL_SECONDS; errors are not.
+
         Args:
             ticker: Stock ticker symbol (e.g., 'AAPL', 'TSLA')
+            horizon: Price history window to fetch ('1mo', '3mo', '6mo' or
+                '1y'). Shorter windows download less; price changes longer
+                than the window are omitted and volatility covers the window.
 
         Returns:
             Dictionary containing stock information and metrics
         """
+        if horizon not in _HORIZONS:
+            raise ValueError(f"Unsupported horizon '{horizon}', expected one of {', '.join(_HORIZONS)}")
+
+        return self._cached(
+            f'stock:{horizon}',
+            ticker,
+            self.CACHE_TTL_SECONDS,
+            lambda symbol: self._fetch_stock_data(symbol, horizon)
+        )
+
+    @classmethod
+    def invalidate(cls, ticker: str) -> None:
+        """Drop all cached data for a ticker."""
+        key = ticker.upper()
+        with cls._cache_lock:
+            for cache_key in [cache_key for cache_key in cls._cache if cache_key[1] == key]:
+                del cls._cache[cache_key]
+
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            try:
+                disk_cache.evict(key)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Could not evict {key} from disk cache: {e}")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached data."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            try:
+                disk_cache.clear()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Could not clear disk cache: {e}")
+
+    def _cached(
+        self,
+        kind: str,
+        ticker: str,
+        ttl: float,
+        fetch: Callable[[str], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Serve a fetch result from the cache, fetching and storing it on a miss.
+
+        Lookups go to memory, then disk, then upstream. Results containing
+        an 'error' key are returned but never cached. Callers always get a
+        copy, so they can't modify the cached result.
+
+        Args:
+            kind: Kind of data, part of the cache key
+            ticker: Stock ticker symbol
+            ttl: Seconds a result stays valid
+            fetch: Uncached fetch function taking the ticker
+
+        Returns:
+            The fetched or cached result
+        """
+        key = (kind, ticker.upper())
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                return copy.deepcopy(entry[1])
+
+        # A locked, corrupt or unwritable disk cache only costs a refetch:
+        # failed reads fall through to upstream, failed writes are skipped.
+        disk_cache = get_disk_cache()
+        data = None
+        if disk_cache is not None:
+            try:
+                data = disk_cache.get(key)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Disk cache read failed for {key}: {e}")
+
+        if data is None:
+            data = fetch(ticker)
+            if 'error' in data:
+                return data
+            if disk_cache is not None:
+                try:
+                    disk_cache.set(key, data, expire=self.settings.financial_cache_ttl, tag=key[1])
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Disk cache write failed for {key}: {e}")
+
+        with self._cache_lock:
+            self._cache[key] = (now + ttl, data)
+            self._evict_cache(now)
+
+        return copy.deepcopy(data)
+
+    def _evict_cache(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones if still over capacity. Caller holds the lock."""
+        if len(self._cache) <= self.CACHE_MAX_SIZE:
+            return
+
+        for key in [key for key, (expires, _) in self._cache.items() if expires <= now]:
+            del self._cache[key]
+
+        while len(self._cache) > self.CACHE_MAX_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+    def _fetch_stock_data(self, ticker: str, horizon: str = "1y") -> Dict[str, Any]:
+        """Fetch stock data from yfinance without caching."""
+        period, change_specs = _HORIZONS[horizon]
+        change_names = [name for name, _, _ in change_specs]
+        change_indices = np.array([index for _, index, _ in change_specs])
+        change_min_lengths = np.array([min_length for _, _, min_length in change_specs])
+
         try:
             stock = yf.Ticker(ticker)
             info = stock.info
-            hist = stock.history(period="1y")
+            hist = stock.history(period=period)
 
-            # Calculate price changes
+            # Calculate all price changes in one pass over the close history
             current_price = info.get('currentPrice', 0)
-            day_change = ((current_price - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0
-            week_change = ((current_price - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] * 100) if len(hist) > 5 else 0
-            month_change = ((current_price - hist['Close'].iloc[-21]) / hist['Close'].iloc[-21] * 100) if len(hist) > 21 else 0
-            year_change = ((current_price - hist['Close'].iloc[0]) / hist['Close'].iloc[0] * 100) if len(hist) > 0 else 0
+            closes = hist['Close'].to_numpy(dtype=float)
+            changes = np.zeros(len(change_specs))
+            if len(closes):
+                available = len(closes) >= change_min_lengths
+                reference = closes[np.where(available, change_indices, 0)]
+                changes = np.where(available, (current_price - reference) / reference * 100, 0.0)
 
-            # Calculate volatility
-            returns = hist['Close'].pct_change()
-            volatility = returns.std() * (252 ** 0.5) * 100  # Annualized volatility
+            # Annualized volatility from daily log returns
+            log_returns = np.diff(np.log(closes))
+            volatility = log_returns.std(ddof=1) * np.sqrt(252) * 100 if len(log_returns) > 1 else 0.0
 
             return {
                 'ticker': ticker,
@@ -49,12 +234,9 @@ class FinancialAPIClient:
                 'current_price': current_price,
                 'market_cap': info.get('marketCap', 0),
                 'price_changes': {
-                    '1_day': round(day_change, 2),
-                    '1_week': round(week_change, 2),
-                    '1_month': round(month_change, 2),
-                    '1_year': round(year_change, 2)
+                    name: round(float(change), 2) for name, change in zip(change_names, changes)
                 },
-                'volatility': round(volatility, 2),
+                'volatility': round(float(volatility), 2),
                 'pe_ratio': info.get('trailingPE', 0),
                 'forward_pe': info.get('forwardPE', 0),
                 'peg_ratio': info.get('pegRatio', 0),
@@ -63,8 +245,8 @@ class FinancialAPIClient:
                 'current_ratio': info.get('currentRatio', 0),
                 'roe': info.get('returnOnEquity', 0),
                 'eps': info.get('trailingEps', 0),
-                'revenue_growth': info.get('revenueGrowth', 0),
-                'earnings_growth': info.get('earningsGrowth', 0),
+                'revenue_growth': info.get('revenueGrowth'),
+                'earnings_growth': info.get('earningsGrowth'),
                 'dividend_yield': info.get('dividendYield', 0),
                 'beta': info.get('beta', 0),
                 '52_week_high': info.get('fiftyTwoWeekHigh', 0),
@@ -73,19 +255,27 @@ class FinancialAPIClient:
                 'target_price': info.get('targetMeanPrice', 0)
             }
         except Exception as e:
-            print(f"Error fetching data for {ticker}: {str(e)}")
+            logger.error(f"Error fetching data for {ticker}: {str(e)}")
             return {'ticker': ticker, 'error': str(e)}
 
     def get_financial_statements(self, ticker: str) -> Dict[str, Any]:
         """
         Fetch financial statements for a given ticker.
 
+        Successful results are cached for STATEMENTS_CACHE_TTL_SECONDS.
+
         Args:
             ticker: Stock ticker symbol
 
         Returns:
             Dictionary containing income statement, balance sheet, and cash flow
         """
+        return self._cached(
+            'statements', ticker, self.STATEMENTS_CACHE_TTL_SECONDS, self._fetch_financial_statements
+        )
+
+    def _fetch_financial_statements(self, ticker: str) -> Dict[str, Any]:
+        """Fetch financial statements from yfinance without caching."""
         try:
             stock = yf.Ticker(ticker)
             return {
@@ -94,7 +284,7 @@ class FinancialAPIClient:
                 'cash_flow': stock.cashflow.to_dict() if hasattr(stock, 'cashflow') else {}
             }
         except Exception as e:
-            print(f"Error fetching financial statements for {ticker}: {str(e)}")
+            logger.error(f"Error fetching financial statements for {ticker}: {str(e)}")
             return {'error': str(e)}
 
 
@@ -144,7 +334,7 @@ class SearchAPIClient:
                 })
             return results
         except Exception as e:
-            print(f"Error with Tavily search: {str(e)}")
+            logger.error(f"Error with Tavily search: {str(e)}")
             return []
 
     def _search_with_serpapi(self, query: str, max_results: int) -> List[Dict[str, Any]]:
@@ -170,7 +360,7 @@ class SearchAPIClient:
                 })
             return results
         except Exception as e:
-            print(f"Error with SerpAPI search: {str(e)}")
+            logger.error(f"Error with SerpAPI search: {str(e)}")
             return []
 
     def _search_with_fallback(self, query: str, max_results: int) -> List[Dict[str, Any]]:
@@ -201,5 +391,5 @@ class SearchAPIClient:
                 return results
             return []
         except Exception as e:
-            print(f"Error with fallback search: {str(e)}")
+            logger.error(f"Error with fallback search: {str(e)}")
             return []
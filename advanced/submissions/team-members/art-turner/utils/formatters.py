@@ -44,8 +44,8 @@ def format_financial_data(data: Dict[str, Any]) -> str:
     output.append(f"  ROE: {data.get('roe', 0):.2%}")
 
     output.append("\nGrowth Metrics:")
-    output.append(f"  Revenue Growth: {data.get('revenue_growth', 0):.2%}")
-    output.append(f"  Earnings Growth: {data.get('earnings_growth', 0):.2%}")
+    output.append(f"  Revenue Growth: {data.get('revenue_growth') or 0:.2%}")
+    output.append(f"  Earnings Growth: {data.get('earnings_growth') or 0:.2%}")
     output.append(f"  EPS: ${data.get('eps', 0):.2f}")
 
     output.append("\nRisk Indicators:")
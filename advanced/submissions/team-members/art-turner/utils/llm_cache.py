@@ -0,0 +1,194 @@
+"""
+Response caching for LLM calls.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Transient API failures worth retrying; APITimeoutError is an
+# APIConnectionError. Client errors (bad request, auth) are not retried.
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+MAX_ATTEMPTS = 3
+BACKOFF_MIN_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+# Caps in-flight completion requests across all agents and threads
+MAX_CONCURRENT_REQUESTS = 8
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of LLM responses.
+
+    Entries are keyed by a hash of the full request (model, messages and
+    sampling parameters), so only byte-identical prompts share a response.
+    Entries expire after ttl seconds.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 24 * 60 * 60):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_size: Maximum number of responses to keep
+            ttl: Seconds a response stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build a cache key for a chat completion request.
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            response_format: Requested response format, if any
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                'model': model,
+                'messages': messages,
+                'temperature': temperature,
+                'max_tokens': max_tokens,
+                'response_format': response_format
+            },
+            sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache, creating it on first use."""
+    return ResponseCache()
+
+
+def _create_completion(client: Any, request: Dict[str, Any]) -> Any:
+    """
+    Send a chat completion request, retrying transient failures with
+    randomized exponential backoff.
+
+    Args:
+        client: OpenAI client
+        request: Keyword arguments for chat.completions.create
+
+    Returns:
+        The completion response
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            with _request_slots:
+                return client.chat.completions.create(**request)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            delay = random.uniform(
+                BACKOFF_MIN_SECONDS,
+                min(BACKOFF_MAX_SECONDS, BACKOFF_MIN_SECONDS * 2 ** attempt)
+            )
+            logger.warning(
+                f"Completion attempt {attempt}/{MAX_ATTEMPTS} failed ({type(e).__name__}), "
+                f"retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+
+def cached_completion(
+    client: Any,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Run a chat completion, serving identical requests from the shared cache.
+
+    Transient errors (rate limits, timeouts, server errors) are retried with
+    backoff; anything still failing is raised, so callers keep their own
+    fallbacks. Failed requests are never cached.
+
+    Args:
+        client: OpenAI client
+        model: Model name
+        messages: Chat messages to send
+        temperature: Sampling temperature
+        max_tokens: Completion token limit
+        response_format: Optional response format, e.g. {"type": "json_object"}
+
+    Returns:
+        Text content of the completion
+    """
+    cache = get_response_cache()
+    key = cache.make_key(model, messages, temperature, max_tokens, response_format)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    request = {
+        'model': model,
+        'messages': messages,
+        'temperature': temperature,
+        'max_tokens': max_tokens
+    }
+    if response_format is not None:
+        request['response_format'] = response_format
+
+    response = _create_completion(client, request)
+
+    content = response.choices[0].message.content
+    cache.set(key, content)
+    return content
@@ -16,23 +16,59 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config.settings import get_settings
-from src.crew import FinResearchCrew, SequentialFinResearchCrew
-from src.tools.memory import MemoryTool
+
+
+# Console output, built once
+_SEP60 = "-" * 60
+_RULE60 = "=" * 60
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                                                                      ║
+║   ███████╗██╗███╗   ██╗██████╗ ███████╗███████╗███████╗ █████╗ ██╗   ║
+║   ██╔════╝██║████╗  ██║██╔══██╗██╔════╝██╔════╝██╔════╝██╔══██╗██║   ║
+║   █████╗  ██║██╔██╗ ██║██████╔╝█████╗  ███████╗█████╗  ███████║██║   ║
+║   ██╔══╝  ██║██║╚██╗██║██╔══██╗██╔══╝  ╚════██║██╔══╝  ██╔══██║██║   ║
+║   ██║     ██║██║ ╚████║██║  ██║███████╗███████║███████╗██║  ██║██║   ║
+║   ╚═╝     ╚═╝╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝╚═╝  ╚═╝╚═╝   ║
+║                                                                      ║
+║          Multi-Agent Financial Research System v1.0.0                ║
+║                                                                      ║
+╚══════════════════════════════════════════════════════════════════════╝
+
+"""
+
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+_LOGGING_READY = False
 
 
 def setup_logging(level: str = "INFO", log_file: str = None) -> None:
     """
     Configure application logging.
     
+    Only the first call takes effect, so repeated main() invocations
+    don't attach duplicate handlers.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path for logging output
     """
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+    
     log_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
     
@@ -42,7 +78,7 @@ def setup_logging(level: str = "INFO", log_file: str = None) -> None:
         handlers.append(logging.FileHandler(log_file))
     
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=_LEVELS[level.upper()],
         format=log_format,
         datefmt=date_format,
         handlers=handlers
@@ -52,6 +88,8 @@ def setup_logging(level: str = "INFO", log_file: str = None) -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
     logging.getLogger("chromadb").setLevel(logging.WARNING)
+    
+    _LOGGING_READY = True
 
 
 def validate_environment() -> bool:
@@ -64,36 +102,24 @@ def validate_environment() -> bool:
     settings = get_settings()
     
     if not settings.openai_api_key:
-        print("\n" + "=" * 60)
+        print("\n" + _RULE60)
         print("ERROR: OPENAI_API_KEY not configured")
-        print("=" * 60)
+        print(_RULE60)
         print("\nPlease set your OpenAI API key:")
         print("  1. Create a .env file in the project root")
         print("  2. Add: OPENAI_API_KEY=sk-your-key-here")
         print("\nOr set the environment variable:")
         print("  export OPENAI_API_KEY='sk-your-key-here'")
-        print("=" * 60 + "\n")
+        print(_RULE60 + "\n")
         return False
     
     return True
 
 
 def print_banner() -> None:
-    """Print application banner."""
-    print("""
-╔══════════════════════════════════════════════════════════════════════╗
-║                                                                      ║
-║   ███████╗██╗███╗   ██╗██████╗ ███████╗███████╗███████╗ █████╗ ██╗   ║
-║   ██╔════╝██║████╗  ██║██╔══██╗██╔════╝██╔════╝██╔════╝██╔══██╗██║   ║
-║   █████╗  ██║██╔██╗ ██║██████╔╝█████╗  ███████╗█████╗  ███████║██║   ║
-║   ██╔══╝  ██║██║╚██╗██║██╔══██╗██╔══╝  ╚════██║██╔══╝  ██╔══██║██║   ║
-║   ██║     ██║██║ ╚████║██║  ██║███████╗███████║███████╗██║  ██║██║   ║
-║   ╚═╝     ╚═╝╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝╚═╝  ╚═╝╚═╝   ║
-║                                                                      ║
-║          Multi-Agent Financial Research System v1.0.0                ║
-║                                                                      ║
-╚══════════════════════════════════════════════════════════════════════╝
-    """)
+    """Print application banner (terminals only, it is decoration)."""
+    if sys.stdout.isatty():
+        sys.stdout.write(_BANNER)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -187,6 +213,22 @@ Examples:
     return parser
 
 
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Get the argument parser, building it on first use.
+    
+    Returns:
+        Shared ArgumentParser instance
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = create_parser()
+    return _PARSER
+
+
 def run_research(args: argparse.Namespace) -> int:
     """
     Execute the research workflow.
@@ -197,6 +239,9 @@ def run_research(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    # Imported here so --help and --dry-run don't pay for loading CrewAI
+    from src.crew import FinResearchCrew, SequentialFinResearchCrew
+    
     logger = logging.getLogger(__name__)
     
     ticker = args.ticker.strip().upper()
@@ -206,7 +251,7 @@ def run_research(args: argparse.Namespace) -> int:
         print(f"\nStarting research for: {company_name} ({ticker})")
         print(f"   Process: {'Sequential' if args.sequential else 'Hierarchical'}")
         print(f"   Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-" * 60)
+        print(_SEP60)
     
     try:
         # Create appropriate crew type
@@ -230,9 +275,9 @@ def run_research(args: argparse.Namespace) -> int:
         report_path = crew.save_report(result, filename=args.output)
         
         if not args.quiet:
-            print("\n" + "=" * 60)
+            print("\n" + _RULE60)
             print("RESEARCH COMPLETE")
-            print("=" * 60)
+            print(_RULE60)
             print(f"\nReport saved to: {report_path}")
             print("\n--- REPORT PREVIEW ---\n")
             print(result[:2000])
@@ -262,10 +307,12 @@ def reset_memory(quiet: bool = False) -> bool:
     Returns:
         True if reset successful, False otherwise
     """
+    from src.tools.memory import get_memory_tool
+    
     logger = logging.getLogger(__name__)
     
     try:
-        memory_tool = MemoryTool()
+        memory_tool = get_memory_tool()
         
         if memory_tool._collection is None:
             if not quiet:
@@ -287,15 +334,18 @@ def reset_memory(quiet: bool = False) -> bool:
         return False
 
 
-def main() -> int:
+def main(args: Optional[argparse.Namespace] = None) -> int:
     """
     Main entry point.
     
+    Args:
+        args: Pre-parsed arguments; parsed from the command line if omitted
+    
     Returns:
         Exit code
     """
-    parser = create_parser()
-    args = parser.parse_args()
+    if args is None:
+        args = get_parser().parse_args()
     
     # Setup logging
     setup_logging(
@@ -314,15 +364,15 @@ def main() -> int:
     # Handle memory reset
     if args.reset_memory:
         if not args.quiet:
-            print("\n" + "-" * 60)
+            print("\n" + _SEP60)
             print("MEMORY RESET")
-            print("-" * 60)
+            print(_SEP60)
         
         if not reset_memory(quiet=args.quiet):
             return 1
         
         if not args.quiet:
-            print("-" * 60 + "\n")
+            print(_SEP60 + "\n")
     
     # Dry run - just validate
     if args.dry_run:
@@ -13,7 +13,7 @@ from crewai import Agent
 from src.agents.base import BaseAgentFactory, create_llm
 from src.config.settings import get_settings
 from src.tools.financial_data import FinancialDataTool
-from src.tools.memory import MemoryTool
+from src.tools.memory import MemoryTool, get_memory_tool
 
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,7 @@ class AnalystAgent:
             memory_tool: Optional shared memory tool instance
             financial_tool: Optional financial data tool instance
         """
-        self._memory_tool = memory_tool or MemoryTool()
+        self._memory_tool = memory_tool or get_memory_tool()
         self._financial_tool = financial_tool or FinancialDataTool()
         self._agent: Optional[Agent] = None
     
@@ -12,7 +12,7 @@ from crewai import Agent
 
 from src.agents.base import BaseAgentFactory, create_llm
 from src.config.settings import get_settings
-from src.tools.memory import MemoryTool
+from src.tools.memory import MemoryTool, get_memory_tool
 
 
 logger = logging.getLogger(__name__)
@@ -38,7 +38,7 @@ class ReporterAgent:
         Args:
             memory_tool: Optional shared memory tool instance
         """
-        self._memory_tool = memory_tool or MemoryTool()
+        self._memory_tool = memory_tool or get_memory_tool()
         self._agent: Optional[Agent] = None
     
     def create(self) -> Agent:
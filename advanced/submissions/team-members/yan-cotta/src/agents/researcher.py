@@ -13,7 +13,7 @@ from crewai import Agent
 from src.agents.base import BaseAgentFactory, create_llm
 from src.config.settings import get_settings
 from src.tools.news_search import NewsSearchTool
-from src.tools.memory import MemoryTool
+from src.tools.memory import MemoryTool, get_memory_tool
 
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,7 @@ class ResearcherAgent:
             memory_tool: Optional shared memory tool instance
             news_tool: Optional news search tool instance
         """
-        self._memory_tool = memory_tool or MemoryTool()
+        self._memory_tool = memory_tool or get_memory_tool()
         self._news_tool = news_tool or NewsSearchTool()
         self._agent: Optional[Agent] = None
     
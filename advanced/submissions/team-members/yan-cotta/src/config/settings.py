@@ -103,6 +103,21 @@ class Settings(BaseSettings):
         description="Timeout for external API requests in seconds"
     )
     
+    # News Cache Configuration
+    news_cache_dir: str = Field(
+        default=".news_cache",
+        description="Directory for cached news search results"
+    )
+    news_cache_ttl: int = Field(
+        default=900,
+        ge=0,
+        description="Seconds a cached news search stays fresh (0 disables caching)"
+    )
+    news_proxy: Optional[str] = Field(
+        default=None,
+        description="Proxy for news searches (http/https/socks5 URL)"
+    )
+    
     class Config:
         """Pydantic configuration."""
         env_prefix = "FINRESEARCH_"
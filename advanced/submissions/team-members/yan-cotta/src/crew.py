@@ -18,7 +18,7 @@ from src.agents.researcher import ResearcherAgent
 from src.agents.analyst import AnalystAgent
 from src.agents.reporter import ReporterAgent
 from src.config.settings import get_settings, TASKS_CONFIG_PATH
-from src.tools.memory import MemoryTool
+from src.tools.memory import get_memory_tool
 from src.tools.news_search import NewsSearchTool
 from src.tools.financial_data import FinancialDataTool
 
@@ -80,7 +80,7 @@ class FinResearchCrew:
         self._tasks_config = load_tasks_config()
         
         # Shared tools (single instances for all agents)
-        self._memory_tool = MemoryTool()
+        self._memory_tool = get_memory_tool()
         self._news_tool = NewsSearchTool()
         self._financial_tool = FinancialDataTool()
         
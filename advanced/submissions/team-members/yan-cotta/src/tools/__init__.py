@@ -2,6 +2,6 @@
 
 from src.tools.financial_data import FinancialDataTool
 from src.tools.news_search import NewsSearchTool
-from src.tools.memory import MemoryTool
+from src.tools.memory import MemoryTool, get_memory_tool
 
-__all__ = ["FinancialDataTool", "NewsSearchTool", "MemoryTool"]
+__all__ = ["FinancialDataTool", "NewsSearchTool", "MemoryTool", "get_memory_tool"]
@@ -3,6 +3,8 @@ Base tool class and shared utilities for FinResearch tools.
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
@@ -34,3 +36,41 @@ class ToolError(Exception):
         self.message = message
         self.original_error = original_error
         super().__init__(f"[{tool_name}] {message}")
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for pacing requests to an external service.
+    
+    Allows bursts of up to `capacity` requests, then `rate` requests per
+    second. Use as a context manager to wait for a slot before a request.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Take the token now, even if it is not there yet, so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
@@ -7,6 +7,7 @@ context, enabling knowledge sharing across the research workflow.
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import json
 
@@ -257,14 +258,15 @@ class MemoryTool(BaseTool):
         """
         Class method to reset all memory.
         
-        Creates a temporary instance and clears the collection.
+        Clears the collection through the shared instance, so tools
+        already handed out see the recreated collection.
         Useful for CLI operations and testing.
         
         Returns:
             True if reset successful, False otherwise
         """
         try:
-            instance = cls()
+            instance = get_memory_tool()
             if instance._collection is None:
                 logger.warning("Memory not available for reset")
                 return False
@@ -273,3 +275,14 @@ class MemoryTool(BaseTool):
         except Exception as e:
             logger.exception(f"Failed to reset memory: {e}")
             return False
+
+
+@lru_cache(maxsize=1)
+def get_memory_tool() -> MemoryTool:
+    """
+    Get the process-wide memory tool.
+    
+    Returns:
+        MemoryTool instance (cached so the ChromaDB client is opened once)
+    """
+    return MemoryTool()
@@ -5,24 +5,77 @@ Provides news discovery with source verification and structured output
 for qualitative research.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
 from crewai.tools import BaseTool
 from pydantic import Field
 
 try:
     from duckduckgo_search import DDGS
+    from duckduckgo_search.exceptions import RatelimitException, TimeoutException
 except ImportError:
     DDGS = None
+    RatelimitException = TimeoutException = None
 
-from src.tools.base import ToolError
+from src.config.settings import get_settings
+from src.tools.base import RateLimiter, ToolError
 
 
 logger = logging.getLogger(__name__)
 
+# Characters that end the host part of a URL
+_HOST_END = re.compile(r"[/?#:]")
+
+_DDGS_NOT_INSTALLED_MSG = (
+    "ERROR: duckduckgo-search library not installed. Run: pip install duckduckgo-search"
+)
+
+# Static pieces of the formatted search output
+_HEADER_RULE = "=" * 60
+_FOOTER = (
+    f"{'-' * 60}\n"
+    "NOTE: Articles marked [VERIFIED] are from known financial news sources.\n"
+    "      Articles marked [UNVERIFIED] should be cross-referenced.\n"
+    "Search completed: "
+)
+
+# DuckDuckGo blocks an IP for minutes after a burst of searches, so pace them
+_search_limiter = RateLimiter(rate=1.0, capacity=2)
+
+# Terms that show a query already has financial context
+_FINANCIAL_TERMS = re.compile(r"stock|share|market|earnings|investor|financial|trading", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class Article:
+    """A processed news article."""
+    
+    title: str
+    url: str
+    source: str
+    date: str
+    snippet: str
+    summary: str  # Snippet truncated for display
+    is_verified: bool
+
+
+# In-process layer over the on-disk news cache: key -> (fetched_at, articles)
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, Tuple[float, List[Article]]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
 
 class NewsSearchTool(BaseTool):
     """
@@ -42,15 +95,29 @@ class NewsSearchTool(BaseTool):
         "Use this for NEWS, SENTIMENT, and QUALITATIVE information, not numbers."
     )
     
-    max_results: int = Field(default=10, description="Maximum articles to return")
+    max_results: int = 10  # Maximum articles to return
+    proxy: Optional[str] = Field(
+        default=None,
+        description="Proxy for DuckDuckGo requests (defaults to the news_proxy setting)"
+    )
+    
+    # Retries for rate-limited or timed-out searches, with exponential backoff
+    MAX_ATTEMPTS: ClassVar[int] = 3
+    RETRY_BASE_DELAY: ClassVar[float] = 2.0
+    
+    # DuckDuckGo times out on queries over 500 characters; leave some margin
+    MAX_QUERY_LENGTH: ClassVar[int] = 480
+    # Longer inputs are not a search query, so reject them outright
+    MAX_INPUT_LENGTH: ClassVar[int] = 2000
+    CONTEXT_SUFFIX: ClassVar[str] = " stock market news"
     
-    # Known credible financial news sources
-    CREDIBLE_SOURCES: List[str] = [
+    # Known credible financial news sources (a ClassVar, so not a pydantic field)
+    CREDIBLE_SOURCES: ClassVar[FrozenSet[str]] = frozenset({
         "reuters.com", "bloomberg.com", "wsj.com", "ft.com", "cnbc.com",
         "marketwatch.com", "seekingalpha.com", "fool.com", "barrons.com",
         "yahoo.com", "finance.yahoo.com", "businessinsider.com", "forbes.com",
         "thestreet.com", "investopedia.com", "benzinga.com"
-    ]
+    })
     
     def _run(self, query: str) -> str:
         """
@@ -64,12 +131,11 @@ class NewsSearchTool(BaseTool):
         """
         if DDGS is None:
             logger.error("duckduckgo-search library not installed")
-            return "ERROR: duckduckgo-search library not installed. Run: pip install duckduckgo-search"
-        
-        query = self._normalize_query(query)
+            return _DDGS_NOT_INSTALLED_MSG
         
         try:
-            articles = self._fetch_news(query)
+            query = self._normalize_query(query)
+            articles = self._get_news(query)
             return self._format_output(query, articles)
         except ToolError as e:
             logger.warning(f"Tool error for query '{query}': {e.message}")
@@ -78,6 +144,15 @@ class NewsSearchTool(BaseTool):
             logger.exception(f"Unexpected error searching news for '{query}'")
             return f"ERROR: Unexpected error searching news: {type(e).__name__}"
     
+    async def _arun(self, query: str) -> str:
+        """
+        Async variant of _run.
+        
+        The search runs in a worker thread, so concurrent calls from async
+        callers proceed in parallel while sharing the cache and HTTP client.
+        """
+        return await asyncio.to_thread(self._run, query)
+    
     def _normalize_query(self, query: str) -> str:
         """Normalize and enhance the search query."""
         if not query or not query.strip():
@@ -85,14 +160,49 @@ class NewsSearchTool(BaseTool):
         
         query = query.strip()
         
-        # Add financial context if not present
-        financial_terms = ['stock', 'share', 'market', 'earnings', 'investor', 'financial', 'trading']
-        if not any(term in query.lower() for term in financial_terms):
-            query = f"{query} stock market news"
+        if len(query) > self.MAX_INPUT_LENGTH:
+            raise ToolError(
+                self.name,
+                f"Search query too long ({len(query)} characters, max {self.MAX_INPUT_LENGTH})"
+            )
+        
+        # Add financial context if not present, trimming the query to fit it
+        if not _FINANCIAL_TERMS.search(query):
+            limit = self.MAX_QUERY_LENGTH - len(self.CONTEXT_SUFFIX)
+            return query[:limit].rstrip() + self.CONTEXT_SUFFIX
         
-        return query
+        return query[:self.MAX_QUERY_LENGTH].rstrip()
     
-    def _fetch_news(self, query: str) -> List[Dict[str, Any]]:
+    def _get_news(self, query: str) -> List[Article]:
+        """
+        Get news articles, serving repeated queries from the cache.
+        
+        DuckDuckGo rate-limits aggressively, so processed results are kept
+        in memory and on disk for `news_cache_ttl` seconds.
+        
+        Args:
+            query: Enhanced search query
+            
+        Returns:
+            List of articles
+        """
+        settings = get_settings()
+        if settings.news_cache_ttl <= 0:
+            return self._fetch_news(query)
+        
+        key = f"{self.max_results}:{query.casefold()}"
+        articles = _read_cached_news(key, settings.news_cache_ttl, settings.news_cache_dir)
+        if articles is not None:
+            logger.debug(f"News cache hit for query: {query}")
+            return articles
+        
+        articles = self._fetch_news(query)
+        # An empty result may be a soft rate limit, so only cache real hits
+        if articles:
+            _write_cached_news(key, articles, settings.news_cache_dir)
+        return articles
+    
+    def _fetch_news(self, query: str) -> List[Article]:
         """
         Fetch news articles from DuckDuckGo.
         
@@ -100,28 +210,26 @@ class NewsSearchTool(BaseTool):
             query: Enhanced search query
             
         Returns:
-            List of article dictionaries
+            List of articles
             
         Raises:
             ToolError: If search fails
         """
         try:
             articles = []
-            
-            with DDGS() as ddgs:
-                results = list(ddgs.news(
-                    keywords=query,
-                    max_results=self.max_results + 5  # Fetch extra for filtering
-                ))
+            results = self._search_with_retry(query)
             
             if not results:
                 logger.info(f"No news results for query: {query}")
                 return []
             
-            for result in results[:self.max_results]:
+            # The extra results stand in for any that fail processing
+            for result in results:
                 article = self._process_article(result)
                 if article:
                     articles.append(article)
+                    if len(articles) == self.max_results:
+                        break
             
             return articles
             
@@ -132,75 +240,197 @@ class NewsSearchTool(BaseTool):
                 original_error=e
             )
     
-    def _process_article(self, raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _search_with_retry(self, query: str) -> List[Dict[str, str]]:
+        """
+        Run the DuckDuckGo news search, backing off on rate limits and timeouts.
+        
+        Args:
+            query: Enhanced search query
+            
+        Returns:
+            Raw search results
+        """
+        settings = get_settings()
+        proxy = self.proxy or settings.news_proxy
+        
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                ddgs = _get_ddgs(proxy, settings.request_timeout)
+                with _search_limiter:
+                    return list(ddgs.news(
+                        keywords=query,
+                        max_results=self.max_results + 5  # Fetch extra for filtering
+                    ))
+            except (RatelimitException, TimeoutException) as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                delay = self.RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning(
+                    f"News search attempt {attempt} failed ({type(e).__name__}), "
+                    f"retrying in {delay:.0f}s"
+                )
+                time.sleep(delay)
+    
+    def _process_article(self, raw: Dict[str, Any]) -> Optional[Article]:
         """Process and validate a single article."""
         url = raw.get('url', '')
         
         if not url:
             return None
         
-        source = raw.get('source', self._extract_source(url))
+        domain = self._extract_source(url)
+        snippet = raw.get('body', 'No summary available.')
         
-        return {
-            "title": raw.get('title', 'No title'),
-            "url": url,
-            "source": source,
-            "date": raw.get('date', 'Unknown'),
-            "snippet": raw.get('body', 'No summary available.'),
-            "is_verified": self._verify_source(url),
-        }
+        return Article(
+            title=raw.get('title', 'No title'),
+            url=url,
+            source=raw.get('source', domain),
+            date=raw.get('date', 'Unknown'),
+            snippet=snippet,
+            summary=snippet if len(snippet) <= 200 else snippet[:200] + "...",
+            is_verified=self._verify_domain(domain),
+        )
     
     def _extract_source(self, url: str) -> str:
         """Extract source domain from URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except Exception:
-            return "Unknown"
+        return _extract_domain(url)
     
     def _verify_source(self, url: str) -> bool:
         """Check if source is from a known credible financial news outlet."""
-        try:
-            domain = self._extract_source(url)
-            return any(credible in domain for credible in self.CREDIBLE_SOURCES)
-        except Exception:
-            return False
+        return self._verify_domain(self._extract_source(url))
+    
+    def _verify_domain(self, domain: str) -> bool:
+        """Check if a domain, or any parent domain, is a credible outlet."""
+        return _is_credible_domain(domain)
     
-    def _format_output(self, query: str, articles: List[Dict[str, Any]]) -> str:
+    def _format_output(self, query: str, articles: List[Article]) -> str:
         """Format articles into structured output for LLM consumption."""
         if not articles:
             return f"No recent news found for: {query}"
         
-        verified_count = sum(1 for a in articles if a['is_verified'])
+        verified_count = sum(1 for a in articles if a.is_verified)
         
-        lines = [
-            f"NEWS SEARCH RESULTS: {query}",
-            "=" * 60,
-            f"Found {len(articles)} articles ({verified_count} from verified sources)",
-            "",
+        parts = [
+            f"NEWS SEARCH RESULTS: {query}\n"
+            f"{_HEADER_RULE}\n"
+            f"Found {len(articles)} articles ({verified_count} from verified sources)\n\n"
         ]
         
         for i, article in enumerate(articles, 1):
-            verified_badge = "[VERIFIED]" if article['is_verified'] else "[UNVERIFIED]"
+            verified_badge = "[VERIFIED]" if article.is_verified else "[UNVERIFIED]"
             
-            lines.extend([
-                f"[{i}] {article['title']}",
-                f"    Source: {article['source']} ({verified_badge})",
-                f"    Date: {article['date']}",
-                f"    URL: {article['url']}",
-                f"    Summary: {article['snippet'][:200]}{'...' if len(article['snippet']) > 200 else ''}",
-                "",
-            ])
-        
-        lines.extend([
-            "-" * 60,
-            "NOTE: Articles marked [VERIFIED] are from known financial news sources.",
-            "      Articles marked [UNVERIFIED] should be cross-referenced.",
-            f"Search completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        ])
-        
-        return "\n".join(lines)
+            parts.append(
+                f"[{i}] {article.title}\n"
+                f"    Source: {article.source} ({verified_badge})\n"
+                f"    Date: {article.date}\n"
+                f"    URL: {article.url}\n"
+                f"    Summary: {article.summary}\n\n"
+            )
+        
+        parts.append(_FOOTER)
+        parts.append(datetime.now(timezone.utc).isoformat(timespec='seconds'))
+        
+        return "".join(parts)
+
+
+@lru_cache(maxsize=8)
+def _get_ddgs(proxy: Optional[str], timeout: int) -> "DDGS":
+    """
+    Get a shared DuckDuckGo client for a proxy and timeout.
+    
+    Each DDGS owns an HTTP client, so reusing one keeps connections and
+    cookies alive across searches instead of reconnecting every time.
+    """
+    return DDGS(proxy=proxy, timeout=timeout)
+
+
+# Domain parsing and verification are pure functions of their input, and the
+# same outlets show up across articles and queries, so results are memoized.
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Extract the lowercased host from a URL, without a www. prefix."""
+    start = url.find('://')
+    if start == -1:
+        return "Unknown"
+    
+    # Slice out the host, dropping any port, path, query or fragment
+    domain = url[start + 3:]
+    end = _HOST_END.search(domain)
+    if end:
+        domain = domain[:end.start()]
+    domain = domain.lower()
+    
+    # Remove www. prefix
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+@lru_cache(maxsize=1024)
+def _is_credible_domain(domain: str) -> bool:
+    """Check if a domain, or any parent domain, is a credible outlet."""
+    credible = NewsSearchTool.CREDIBLE_SOURCES
+    if domain in credible:
+        return True
+    
+    # news.bloomberg.com -> bloomberg.com -> com
+    while '.' in domain:
+        domain = domain.split('.', 1)[1]
+        if domain in credible:
+            return True
+    
+    return False
+
+
+def _news_cache_file(key: str, cache_dir: str) -> Path:
+    """Path of the on-disk cache entry for a query key."""
+    return Path(cache_dir) / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _remember_news(key: str, fetched_at: float, articles: List[Article]) -> None:
+    """Store a result in the in-process cache, evicting the oldest if full."""
+    with _memory_cache_lock:
+        _memory_cache[key] = (fetched_at, articles)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _read_cached_news(key: str, ttl: int, cache_dir: str) -> Optional[List[Article]]:
+    """Return cached articles for a query key if younger than ttl seconds."""
+    now = time.time()
+    
+    with _memory_cache_lock:
+        entry = _memory_cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return list(entry[1])
+    
+    try:
+        entry = json.loads(_news_cache_file(key, cache_dir).read_text(encoding="utf-8"))
+        fetched_at = entry["fetched_at"]
+        articles = [Article(**article) for article in entry["articles"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if now - fetched_at >= ttl:
+        return None
+    
+    _remember_news(key, fetched_at, articles)
+    return list(articles)
+
+
+def _write_cached_news(key: str, articles: List[Article], cache_dir: str) -> None:
+    """Store articles for a query key in memory and on disk."""
+    fetched_at = time.time()
+    _remember_news(key, fetched_at, articles)
+    
+    try:
+        path = _news_cache_file(key, cache_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"fetched_at": fetched_at, "articles": [asdict(a) for a in articles]}),
+            encoding="utf-8"
+        )
+    except OSError as e:
+        logger.warning(f"Could not write news cache: {e}")
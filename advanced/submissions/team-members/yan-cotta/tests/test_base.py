@@ -0,0 +1,81 @@
+"""
+Unit Tests for the shared tool helpers.
+
+Tests the RateLimiter token bucket against a fake clock, so no real time
+passes during these tests.
+"""
+
+from typing import List
+
+import pytest
+
+from src.tools import base
+from src.tools.base import RateLimiter
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and time.sleep that records each wait."""
+
+    def __init__(self, advance_on_sleep: bool = False) -> None:
+        self.now = 1000.0
+        self.waits: List[float] = []
+        self.advance_on_sleep = advance_on_sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.waits.append(seconds)
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+def acquire_waits(limiter: RateLimiter, clock: FakeClock, count: int) -> List[float]:
+    """Acquire count times and return how long each acquisition waited."""
+    waits = []
+    for _ in range(count):
+        before = len(clock.waits)
+        with limiter:
+            pass
+        waits.append(clock.waits[before] if len(clock.waits) > before else 0.0)
+    return waits
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Patch the time functions RateLimiter uses with a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(base.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(base.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestRateLimiter:
+    """Tests for burst-then-pace request scheduling."""
+
+    def test_burst_then_queued_waits(self, clock: FakeClock) -> None:
+        """Test that simultaneous callers past the burst queue 1/rate apart."""
+        limiter = RateLimiter(rate=2.0, capacity=2)
+
+        waits = acquire_waits(limiter, clock, 5)
+
+        assert waits == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+    def test_steady_pace_after_burst(self, clock: FakeClock) -> None:
+        """Test that a caller who sleeps as told waits 1/rate per request."""
+        clock.advance_on_sleep = True
+        limiter = RateLimiter(rate=1.0, capacity=2)
+
+        waits = acquire_waits(limiter, clock, 5)
+
+        assert waits == pytest.approx([0.0, 0.0, 1.0, 1.0, 1.0])
+
+    def test_idle_time_refills_up_to_capacity(self, clock: FakeClock) -> None:
+        """Test that a long pause restores the burst, but no more than it."""
+        limiter = RateLimiter(rate=1.0, capacity=2)
+        acquire_waits(limiter, clock, 2)
+
+        clock.now += 60
+        waits = acquire_waits(limiter, clock, 3)
+
+        assert waits == pytest.approx([0.0, 0.0, 1.0])
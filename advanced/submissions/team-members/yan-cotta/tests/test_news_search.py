@@ -0,0 +1,268 @@
+"""
+Unit Tests for NewsSearchTool.
+
+Tests domain parsing, source verification and the news cache with a fake
+DuckDuckGo client. No network calls are made during these tests.
+"""
+
+import json
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from src.config.settings import get_settings
+from src.tools import news_search
+from src.tools.news_search import NewsSearchTool, _extract_domain, _is_credible_domain
+
+
+# -----------------------------------------------------------------------------
+# Shared Fixtures
+# -----------------------------------------------------------------------------
+
+class FakeDDGS:
+    """Stand-in for duckduckgo_search.DDGS that counts searches."""
+
+    results: List[Dict[str, Any]] = []
+    errors: List[Exception] = []  # Raised, one per search, before any results
+    calls = 0
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    def news(self, keywords: str, max_results: int) -> List[Dict[str, Any]]:
+        FakeDDGS.calls += 1
+        if FakeDDGS.errors:
+            raise FakeDDGS.errors.pop(0)
+        return list(FakeDDGS.results)
+
+
+class FakeRatelimitException(Exception):
+    """Stand-in for duckduckgo_search.exceptions.RatelimitException."""
+
+
+class FakeTimeoutException(Exception):
+    """Stand-in for duckduckgo_search.exceptions.TimeoutException."""
+
+
+@pytest.fixture
+def fake_ddgs(monkeypatch, tmp_path):
+    """Route searches to FakeDDGS with a fresh cache under tmp_path."""
+    monkeypatch.setenv("FINRESEARCH_NEWS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("FINRESEARCH_NEWS_CACHE_TTL", "900")
+    monkeypatch.setattr(news_search, "DDGS", FakeDDGS)
+    monkeypatch.setattr(news_search, "_search_limiter", nullcontext())
+    monkeypatch.setattr(news_search, "RatelimitException", FakeRatelimitException)
+    monkeypatch.setattr(news_search, "TimeoutException", FakeTimeoutException)
+    FakeDDGS.results = [
+        {
+            "title": "Apple beats earnings",
+            "url": "https://www.reuters.com/apple",
+            "source": "Reuters",
+            "date": "2024-01-01",
+            "body": "Apple reported record revenue.",
+        }
+    ]
+    FakeDDGS.errors = []
+    FakeDDGS.calls = 0
+
+    get_settings.cache_clear()
+    news_search._get_ddgs.cache_clear()
+    news_search._memory_cache.clear()
+    yield FakeDDGS
+    get_settings.cache_clear()
+    news_search._get_ddgs.cache_clear()
+    news_search._memory_cache.clear()
+
+
+def age_cache(cache_dir: Path, seconds: float) -> None:
+    """Make every cached entry, in memory and on disk, older by seconds."""
+    for key, (fetched_at, articles) in list(news_search._memory_cache.items()):
+        news_search._memory_cache[key] = (fetched_at - seconds, articles)
+
+    for path in cache_dir.glob("*.json"):
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry["fetched_at"] -= seconds
+        path.write_text(json.dumps(entry), encoding="utf-8")
+
+
+class TestExtractDomain:
+    """Tests for pulling the source domain out of article URLs."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://reuters.com/markets/apple", "reuters.com"),
+            ("https://www.reuters.com/markets/apple", "reuters.com"),
+            ("https://WWW.Reuters.COM/markets", "reuters.com"),
+            ("https://reuters.com:443/markets", "reuters.com"),
+            ("https://reuters.com?id=1", "reuters.com"),
+            ("https://reuters.com#top", "reuters.com"),
+            ("http://uk.reuters.com", "uk.reuters.com"),
+        ],
+    )
+    def test_host_is_extracted(self, url: str, expected: str) -> None:
+        """Test that port, path, query, fragment and www. are stripped."""
+        assert _extract_domain(url) == expected
+
+    @pytest.mark.parametrize("url", ["reuters.com/markets", "www.reuters.com", ""])
+    def test_url_without_scheme_is_unknown(self, url: str) -> None:
+        """Test that URLs without a scheme are not guessed at."""
+        assert _extract_domain(url) == "Unknown"
+
+
+class TestIsCredibleDomain:
+    """Tests for matching domains against the credible source list."""
+
+    @pytest.mark.parametrize(
+        "domain",
+        ["reuters.com", "uk.reuters.com", "news.bloomberg.com", "finance.yahoo.com"],
+    )
+    def test_listed_domain_and_subdomains_verified(self, domain: str) -> None:
+        """Test that listed outlets and their subdomains are verified."""
+        assert _is_credible_domain(domain)
+
+    @pytest.mark.parametrize(
+        "domain",
+        ["evilreuters.com", "reuters.com.evil.net", "com", "Unknown", ""],
+    )
+    def test_look_alike_domains_not_verified(self, domain: str) -> None:
+        """Test that look-alike and unrelated domains are not verified."""
+        assert not _is_credible_domain(domain)
+
+
+class TestNewsCache:
+    """Tests for the in-memory and on-disk news cache."""
+
+    def test_repeated_query_served_from_memory(self, fake_ddgs) -> None:
+        """Test that a repeated query does not search again."""
+        tool = NewsSearchTool()
+
+        first = tool._run("Apple earnings")
+        second = tool._run("apple EARNINGS")
+
+        assert fake_ddgs.calls == 1
+        assert "Apple beats earnings" in first
+        assert "Apple beats earnings" in second
+
+    def test_query_served_from_disk_after_restart(self, fake_ddgs, tmp_path) -> None:
+        """Test that the disk cache survives a cleared in-process cache."""
+        NewsSearchTool()._run("Apple earnings")
+        assert list(tmp_path.glob("*.json"))
+
+        news_search._memory_cache.clear()
+        result = NewsSearchTool()._run("Apple earnings")
+
+        assert fake_ddgs.calls == 1
+        assert "[VERIFIED]" in result
+
+    def test_expired_memory_entry_falls_back_to_disk(self, fake_ddgs) -> None:
+        """Test that a stale memory entry is skipped for a fresh disk entry."""
+        tool = NewsSearchTool()
+        tool._run("Apple earnings")
+
+        key = next(iter(news_search._memory_cache))
+        fetched_at, articles = news_search._memory_cache[key]
+        news_search._memory_cache[key] = (fetched_at - 1000, articles)
+        tool._run("Apple earnings")
+
+        assert fake_ddgs.calls == 1
+
+    def test_expired_entries_are_refetched(self, fake_ddgs, tmp_path) -> None:
+        """Test that entries older than the TTL are a miss in both layers."""
+        tool = NewsSearchTool()
+        tool._run("Apple earnings")
+
+        age_cache(tmp_path, 1000)
+        tool._run("Apple earnings")
+
+        assert fake_ddgs.calls == 2
+
+    def test_zero_ttl_bypasses_cache(self, fake_ddgs, monkeypatch, tmp_path) -> None:
+        """Test that news_cache_ttl=0 searches every time and stores nothing."""
+        monkeypatch.setenv("FINRESEARCH_NEWS_CACHE_TTL", "0")
+        get_settings.cache_clear()
+        tool = NewsSearchTool()
+
+        tool._run("Apple earnings")
+        tool._run("Apple earnings")
+
+        assert fake_ddgs.calls == 2
+        assert not news_search._memory_cache
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_empty_results_not_cached(self, fake_ddgs, tmp_path) -> None:
+        """Test that empty results, possibly a soft rate limit, are retried."""
+        fake_ddgs.results = []
+        tool = NewsSearchTool()
+
+        assert "No recent news found" in tool._run("Apple earnings")
+        tool._run("Apple earnings")
+
+        assert fake_ddgs.calls == 2
+        assert not list(tmp_path.glob("*.json"))
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", "[]", '{"fetched_at": 0}', '{"fetched_at": 0, "articles": [{"title": "x"}]}'],
+    )
+    def test_corrupt_cache_file_is_a_miss(self, fake_ddgs, tmp_path, content: str) -> None:
+        """Test that an unreadable cache file is refetched and overwritten."""
+        tool = NewsSearchTool()
+        tool._run("Apple earnings")
+        news_search._memory_cache.clear()
+
+        (path,) = tmp_path.glob("*.json")
+        path.write_text(content, encoding="utf-8")
+        result = tool._run("Apple earnings")
+
+        assert fake_ddgs.calls == 2
+        assert "Apple beats earnings" in result
+        assert json.loads(path.read_text(encoding="utf-8"))["articles"]
+
+
+class TestSearchRetry:
+    """Tests for backing off on DuckDuckGo rate limits and timeouts."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch) -> List[float]:
+        """Record backoff delays instead of sleeping."""
+        delays: List[float] = []
+        monkeypatch.setattr(news_search.time, "sleep", delays.append)
+        return delays
+
+    def test_rate_limited_search_is_retried(self, fake_ddgs, sleeps: List[float]) -> None:
+        """Test that a rate-limited search succeeds on the next attempt."""
+        fake_ddgs.errors = [FakeRatelimitException("202 Ratelimit")]
+
+        result = NewsSearchTool()._run("Apple earnings")
+
+        assert fake_ddgs.calls == 2
+        assert sleeps == [NewsSearchTool.RETRY_BASE_DELAY]
+        assert "Apple beats earnings" in result
+
+    def test_error_reported_after_max_attempts(self, fake_ddgs, sleeps: List[float]) -> None:
+        """Test that the last failure is reported once attempts run out."""
+        fake_ddgs.errors = [
+            FakeTimeoutException("timed out")
+            for _ in range(NewsSearchTool.MAX_ATTEMPTS)
+        ]
+
+        result = NewsSearchTool()._run("Apple earnings")
+
+        assert fake_ddgs.calls == NewsSearchTool.MAX_ATTEMPTS
+        base = NewsSearchTool.RETRY_BASE_DELAY
+        assert sleeps == [base * 2 ** i for i in range(NewsSearchTool.MAX_ATTEMPTS - 1)]
+        assert result.startswith("ERROR: Failed to search news")
+        assert not news_search._memory_cache
+
+    def test_other_errors_are_not_retried(self, fake_ddgs, sleeps: List[float]) -> None:
+        """Test that errors other than rate limits and timeouts fail at once."""
+        fake_ddgs.errors = [ValueError("bad response")]
+
+        result = NewsSearchTool()._run("Apple earnings")
+
+        assert fake_ddgs.calls == 1
+        assert not sleeps
+        assert "ERROR" in result
@@ -41,6 +41,7 @@ KEY CONCEPTS COVERED:
     4. Runs - Executing the assistant on a thread
     5. Function Calling - Custom tools with the Assistants API
     6. Polling - Waiting for runs to complete
+    7. Streaming - Receiving run events and the reply as they happen
 
 ARCHITECTURE:
     ┌──────────┐     ┌──────────────┐     ┌──────────────┐
@@ -64,10 +65,18 @@ Author: Yan Cotta | FinResearch AI Project
 import os
 import sys
 import json
+import hashlib
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+# Console separators, built once
+_SEP50 = "-" * 50
+_SEP70 = "=" * 70
+
 # =============================================================================
 # STEP 0: ENVIRONMENT SETUP
 # =============================================================================
@@ -90,13 +99,13 @@ def validate_environment() -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     
     if not api_key:
-        print("\n" + "=" * 70)
+        print("\n" + _SEP70)
         print("❌ ERROR: OPENAI_API_KEY not found!")
-        print("=" * 70)
+        print(_SEP70)
         print("\nThe Assistants API requires a valid OpenAI API key.")
         print("Please add it to your .env file:")
         print("  OPENAI_API_KEY=sk-your-key-here")
-        print("=" * 70 + "\n")
+        print(_SEP70 + "\n")
         sys.exit(1)
     
     return api_key
@@ -111,14 +120,115 @@ API_KEY = validate_environment()
 # Assistants API through the client.beta.assistants namespace.
 # The 'beta' prefix indicates this is a newer API still being refined.
 
-from openai import OpenAI
+from openai import AssistantEventHandler, NotFoundError, OpenAI
 
 # Initialize the client
 client = OpenAI()
 
 # For financial data
+import numpy as np
 import yfinance as yf
 
+# For validating tool arguments
+import fastjsonschema
+
+# For parsing tool arguments - orjson is much faster than the standard
+# library's json, but it is optional
+try:
+    import orjson
+    
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# =============================================================================
+# STEP 1b: CACHE MARKET DATA LOOKUPS
+# =============================================================================
+# CONCEPT: During one conversation the assistant often calls several tools for
+# the same ticker (price, then fundamentals, then performance). Each call would
+# hit Yahoo Finance again, so we keep results for a while, keyed on
+# (kind, ticker, period). Fast-moving data (today's price) expires sooner than
+# slow-moving data (fundamentals). A lock keeps the cache safe if tool calls
+# run in parallel.
+
+PRICE_TTL_SECONDS = 60
+CACHE_TTL_SECONDS = 300
+FUNDAMENTALS_TTL_SECONDS = 900
+_market_data_cache: Dict[tuple, tuple] = {}
+_market_data_lock = threading.RLock()
+
+
+def _cached_market_data(
+    kind: str,
+    ticker: str,
+    period: Optional[str],
+    fetch,
+    ttl: float = CACHE_TTL_SECONDS
+) -> Any:
+    """Returns a cached yfinance result, calling fetch() on a miss or after expiry."""
+    key = (kind, ticker, period)
+    now = time.monotonic()
+
+    with _market_data_lock:
+        entry = _market_data_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    value = fetch()
+    with _market_data_lock:
+        _market_data_cache[key] = (now + ttl, value)
+    return value
+
+
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Returns one shared yf.Ticker per symbol, so its session is reused
+    across tool calls.
+
+    yf.Ticker keeps .info after its first fetch, so the Ticker lives in the
+    same cache as the data and expires no later than its "info" entry;
+    invalidate_market_data() drops it too.
+    """
+    return _cached_market_data(
+        "ticker", symbol, None, lambda: yf.Ticker(symbol), ttl=FUNDAMENTALS_TTL_SECONDS
+    )
+
+
+def get_ticker_info(ticker: str) -> Dict[str, Any]:
+    """Returns yfinance Ticker.info for a ticker, cached."""
+    return _cached_market_data(
+        "info", ticker, None, lambda: _get_ticker(ticker).info, ttl=FUNDAMENTALS_TTL_SECONDS
+    )
+
+
+def get_ticker_history(ticker: str, period: str):
+    """Returns yfinance price history for a ticker and period, cached."""
+    ttl = PRICE_TTL_SECONDS if period == "1d" else CACHE_TTL_SECONDS
+    return _cached_market_data(
+        "history", ticker, period, lambda: _get_ticker(ticker).history(period=period), ttl=ttl
+    )
+
+
+def invalidate_market_data(ticker: str) -> None:
+    """Drops all cached market data for a ticker."""
+    ticker = ticker.strip().upper()
+    with _market_data_lock:
+        for key in [key for key in _market_data_cache if key[1] == ticker]:
+            del _market_data_cache[key]
+        # Tool results are keyed on their JSON arguments; drop any naming the ticker
+        for key in [key for key in _tool_result_cache if ticker in _argument_tickers(key[1])]:
+            del _tool_result_cache[key]
+
+
+def _argument_tickers(arguments: str) -> List[str]:
+    """Returns the tickers named in a tool call's JSON arguments, uppercased."""
+    arguments = json_loads(arguments)
+    tickers = [arguments.get("ticker", "")] + arguments.get("tickers", "").split(",")
+    return [ticker.strip().upper() for ticker in tickers if ticker.strip()]
+
 # =============================================================================
 # STEP 2: DEFINE OUR FINANCIAL RESEARCH TOOLS
 # =============================================================================
@@ -134,14 +244,13 @@ def get_stock_price(ticker: str) -> str:
     """Fetches current stock price for a ticker symbol."""
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
-        history = stock.history(period="1d")
+        history = get_ticker_history(ticker, "1d")
         
         if history.empty:
             return json.dumps({"error": f"No data found for {ticker}"})
         
         price = history['Close'].iloc[-1]
-        company_name = stock.info.get('shortName', ticker)
+        company_name = get_ticker_info(ticker).get('shortName', ticker)
         
         return json.dumps({
             "ticker": ticker,
@@ -157,8 +266,7 @@ def get_company_fundamentals(ticker: str) -> str:
     """Fetches comprehensive fundamental data for analysis."""
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = get_ticker_info(ticker)
         
         # Extract comprehensive data
         fundamentals = {
@@ -201,27 +309,27 @@ def get_stock_performance(ticker: str, period: str = "1y") -> str:
     """Analyzes stock performance over a given period."""
     try:
         ticker = ticker.strip().upper()
-        stock = yf.Ticker(ticker)
-        history = stock.history(period=period)
+        history = get_ticker_history(ticker, period)
         
         if history.empty:
             return json.dumps({"error": f"No data for {ticker}"})
         
-        # Calculate performance metrics
-        start_price = history['Close'].iloc[0]
-        end_price = history['Close'].iloc[-1]
-        high_price = history['High'].max()
-        low_price = history['Low'].min()
+        # Calculate performance metrics on plain NumPy arrays
+        closes = history['Close'].to_numpy(dtype=float)
+        start_price = closes[0]
+        end_price = closes[-1]
+        high_price = history['High'].to_numpy().max()
+        low_price = history['Low'].to_numpy().min()
         
         total_return = ((end_price - start_price) / start_price) * 100
         
-        # Calculate volatility (annualized)
-        daily_returns = history['Close'].pct_change().dropna()
-        volatility = daily_returns.std() * (252 ** 0.5) * 100
+        # Calculate volatility (annualized, from daily log returns)
+        log_returns = np.diff(np.log(closes))
+        volatility = log_returns.std(ddof=1) * np.sqrt(252) * 100 if len(log_returns) > 1 else 0.0
         
-        # Calculate max drawdown
-        rolling_max = history['Close'].expanding().max()
-        drawdowns = (history['Close'] - rolling_max) / rolling_max
+        # Calculate max drawdown against the running peak
+        running_max = np.maximum.accumulate(closes)
+        drawdowns = (closes - running_max) / running_max
         max_drawdown = drawdowns.min() * 100
         
         performance = {
@@ -242,35 +350,41 @@ def get_stock_performance(ticker: str, period: str = "1y") -> str:
         return json.dumps({"error": str(e)})
 
 
+def _compare_single_stock(ticker: str) -> Optional[Dict[str, Any]]:
+    """Fetches comparison metrics for one ticker, or None if it has no history."""
+    info = get_ticker_info(ticker)
+    history = get_ticker_history(ticker, "1y")
+    
+    if history.empty:
+        return None
+        
+    # Calculate 1-year return
+    start_price = history['Close'].iloc[0]
+    end_price = history['Close'].iloc[-1]
+    one_year_return = ((end_price - start_price) / start_price) * 100
+    
+    return {
+        "ticker": ticker,
+        "company": info.get('shortName', ticker),
+        "current_price": round(end_price, 2),
+        "market_cap_b": round(info.get('marketCap', 0) / 1e9, 2),
+        "pe_ratio": info.get('trailingPE', None),
+        "1y_return_pct": round(one_year_return, 2),
+        "dividend_yield_pct": round((info.get('dividendYield', 0) or 0) * 100, 2)
+    }
+
+
 def compare_stocks(tickers: str) -> str:
     """Compares multiple stocks on key metrics."""
     try:
         # Parse comma-separated tickers
-        ticker_list = [t.strip().upper() for t in tickers.split(",")]
+        ticker_list = [t.strip().upper() for t in tickers.split(",")][:5]  # Limit to 5 stocks
         
-        comparisons = []
-        for ticker in ticker_list[:5]:  # Limit to 5 stocks
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            history = stock.history(period="1y")
-            
-            if history.empty:
-                continue
-                
-            # Calculate 1-year return
-            start_price = history['Close'].iloc[0]
-            end_price = history['Close'].iloc[-1]
-            one_year_return = ((end_price - start_price) / start_price) * 100
-            
-            comparisons.append({
-                "ticker": ticker,
-                "company": info.get('shortName', ticker),
-                "current_price": round(end_price, 2),
-                "market_cap_b": round(info.get('marketCap', 0) / 1e9, 2),
-                "pe_ratio": info.get('trailingPE', None),
-                "1y_return_pct": round(one_year_return, 2),
-                "dividend_yield_pct": round((info.get('dividendYield', 0) or 0) * 100, 2)
-            })
+        # CONCEPT: Each lookup is a network round trip, so we fetch all tickers
+        # at once on a small thread pool. map() keeps the caller's ticker order.
+        with ThreadPoolExecutor(max_workers=max(len(ticker_list), 1)) as executor:
+            results = executor.map(_compare_single_stock, ticker_list)
+            comparisons = [result for result in results if result is not None]
         
         return json.dumps({"comparisons": comparisons})
     except Exception as e:
@@ -360,6 +474,9 @@ TOOL_DEFINITIONS = [
     }
 ]
 
+# Serialized once at import, for hashing the assistant config
+_TOOL_DEFINITIONS_JSON = json.dumps(TOOL_DEFINITIONS, sort_keys=True).encode("utf-8")
+
 # Map function names to actual functions
 FUNCTION_MAP = {
     "get_stock_price": get_stock_price,
@@ -368,6 +485,44 @@ FUNCTION_MAP = {
     "compare_stocks": compare_stocks
 }
 
+# CONCEPT: The model usually sends valid arguments, but not always. We build
+# one validator per tool from its schema once, at import, rather than on every
+# call, and check the arguments before running the tool. fastjsonschema turns
+# each schema into plain Python code, so a check is just a few comparisons.
+_TOOL_VALIDATORS = {
+    tool["function"]["name"]: fastjsonschema.compile(tool["function"]["parameters"])
+    for tool in TOOL_DEFINITIONS
+}
+
+# CONCEPT: Within a run (and across runs in a thread) the assistant often asks
+# the same question twice, e.g. get_stock_price("AAPL") before and after
+# looking at fundamentals. We memoize whole tool results for a per-tool time,
+# keyed on (function name, arguments). Errors are never cached.
+_TOOL_TTLS = {
+    "get_stock_price": PRICE_TTL_SECONDS,
+    "get_company_fundamentals": FUNDAMENTALS_TTL_SECONDS,
+    "get_stock_performance": CACHE_TTL_SECONDS,
+    "compare_stocks": CACHE_TTL_SECONDS
+}
+_tool_result_cache: Dict[tuple, tuple] = {}
+
+
+def call_tool_cached(function_name: str, arguments: Dict[str, Any]) -> str:
+    """Runs a tool, reusing its result for repeated calls with the same arguments."""
+    key = (function_name, json.dumps(arguments, sort_keys=True))
+    now = time.monotonic()
+
+    with _market_data_lock:
+        entry = _tool_result_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    result = FUNCTION_MAP[function_name](**arguments)
+    if "error" not in json_loads(result):
+        with _market_data_lock:
+            _tool_result_cache[key] = (now + _TOOL_TTLS.get(function_name, CACHE_TTL_SECONDS), result)
+    return result
+
 # =============================================================================
 # STEP 4: CREATE OR RETRIEVE THE ASSISTANT
 # =============================================================================
@@ -380,17 +535,9 @@ FUNCTION_MAP = {
 # a new assistant every run (which would clutter your OpenAI dashboard).
 
 
-def create_financial_assistant() -> str:
-    """
-    Creates a new Financial Research Assistant.
-    
-    Returns the assistant ID for future use.
-    """
-    print("🔧 Creating Financial Research Assistant...")
-    
-    assistant = client.beta.assistants.create(
-        name="FinResearch AI - Financial Analyst",
-        instructions="""You are an expert financial research analyst assistant. Your role is to:
+ASSISTANT_NAME = "FinResearch AI - Financial Analyst"
+ASSISTANT_MODEL = "gpt-4-turbo-preview"  # Use gpt-4 for better analysis
+ASSISTANT_INSTRUCTIONS = """You are an expert financial research analyst assistant. Your role is to:
 
 1. ANALYZE stocks and companies using real market data
 2. PROVIDE clear, actionable insights based on fundamental and technical analysis
@@ -410,9 +557,49 @@ IMPORTANT DISCLAIMERS:
 - Past performance doesn't guarantee future results
 - Data may be delayed or incomplete
 
-Format your responses with clear headers and bullet points for readability.""",
-        
-        model="gpt-4-turbo-preview",  # Use gpt-4 for better analysis
+Format your responses with clear headers and bullet points for readability."""
+
+# Maps assistant config hashes to the IDs of assistants created with them
+ASSISTANT_ID_CACHE = Path.home() / ".cache" / "finresearch" / "assistant_id"
+
+
+def _assistant_config_hash() -> str:
+    """Hashes everything that defines the assistant, so any change gets a new one."""
+    config_hash = hashlib.sha256()
+    for part in (ASSISTANT_MODEL.encode("utf-8"), ASSISTANT_INSTRUCTIONS.encode("utf-8"), _TOOL_DEFINITIONS_JSON):
+        # Length-prefix each part so their boundaries are unambiguous
+        config_hash.update(len(part).to_bytes(8, "big"))
+        config_hash.update(part)
+    return config_hash.hexdigest()
+
+
+def _load_assistant_ids() -> Dict[str, str]:
+    try:
+        return json.loads(ASSISTANT_ID_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_assistant_ids(assistant_ids: Dict[str, str]) -> None:
+    try:
+        ASSISTANT_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        ASSISTANT_ID_CACHE.write_text(json.dumps(assistant_ids))
+    except OSError as e:
+        print(f"⚠️  Could not save assistant ID: {e}")
+
+
+def create_financial_assistant() -> str:
+    """
+    Creates a new Financial Research Assistant.
+    
+    Returns the assistant ID for future use.
+    """
+    print("🔧 Creating Financial Research Assistant...")
+    
+    assistant = client.beta.assistants.create(
+        name=ASSISTANT_NAME,
+        instructions=ASSISTANT_INSTRUCTIONS,
+        model=ASSISTANT_MODEL,
         tools=TOOL_DEFINITIONS
     )
     
@@ -424,15 +611,27 @@ def get_or_create_assistant() -> str:
     """
     Retrieves existing assistant or creates a new one.
     
-    For this demo, we always create a new assistant to avoid ID management.
-    In production, you'd store and reuse the assistant ID.
+    The assistant ID is cached on disk under a hash of the assistant's
+    model, instructions and tools, so later runs with the same config
+    reuse the same assistant instead of creating another one.
     """
-    # In production, you might store the ID in a file or database:
-    # assistant_id = load_from_storage()
-    # if assistant_id:
-    #     return assistant_id
+    config_hash = _assistant_config_hash()
+    assistant_ids = _load_assistant_ids()
     
-    return create_financial_assistant()
+    assistant_id = assistant_ids.get(config_hash)
+    if assistant_id:
+        # Make sure it still exists - it may have been deleted on the dashboard
+        try:
+            client.beta.assistants.retrieve(assistant_id)
+            print(f"♻️  Reusing assistant {assistant_id}")
+            return assistant_id
+        except NotFoundError:
+            pass
+    
+    assistant_id = create_financial_assistant()
+    assistant_ids[config_hash] = assistant_id
+    _save_assistant_ids(assistant_ids)
+    return assistant_id
 
 
 # =============================================================================
@@ -483,7 +682,11 @@ def add_message_to_thread(thread_id: str, content: str) -> None:
     )
 
 
-def run_assistant(assistant_id: str, thread_id: str) -> str:
+POLL_INITIAL_DELAY = 0.05  # seconds
+POLL_MAX_DELAY = 1.0
+
+
+def run_assistant(assistant_id: str, thread_id: str, quiet: bool = False) -> str:
     """
     Runs the assistant on the thread and returns the response.
     
@@ -491,6 +694,8 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
     1. Start the run
     2. Poll for completion (handling tool calls if needed)
     3. Extract and return the final response
+    
+    Set quiet to hide the run status updates.
     """
     # Start the run
     run = client.beta.threads.runs.create(
@@ -500,6 +705,16 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
     
     print(f"🚀 Run started (ID: {run.id})")
     
+    # CONCEPT: Runs often finish (or need tools) within a fraction of a second,
+    # so we poll quickly at first and back off exponentially up to 1 second.
+    # This answers fast runs sooner and sends fewer requests for slow ones.
+    delay = POLL_INITIAL_DELAY
+    
+    # Only show the status when it changes, and only on a terminal - the
+    # carriage returns would otherwise fill log files with one line per poll
+    show_status = not quiet and sys.stdout.isatty()
+    last_status = None
+    
     # Poll for completion
     while True:
         run = client.beta.threads.runs.retrieve(
@@ -508,7 +723,9 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
         )
         
         status = run.status
-        print(f"   Status: {status}", end="\r")
+        if show_status and status != last_status:
+            print(f"   Status: {status}", end="\r")
+        last_status = status
         
         if status == "completed":
             print("\n✅ Run completed!")
@@ -518,6 +735,7 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
             # The assistant wants to call tools!
             print("\n🔧 Processing tool calls...")
             run = handle_tool_calls(thread_id, run)
+            delay = POLL_INITIAL_DELAY  # The run restarts after tool outputs
             
         elif status in ["failed", "cancelled", "expired"]:
             print(f"\n❌ Run {status}")
@@ -527,7 +745,8 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
             
         else:
             # Still processing - wait a bit before polling again
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
     
     # Get the assistant's response
     messages = client.beta.threads.messages.list(
@@ -541,34 +760,65 @@ def run_assistant(assistant_id: str, thread_id: str) -> str:
     return "No response generated"
 
 
-def handle_tool_calls(thread_id: str, run) -> Any:
+@lru_cache(maxsize=32)
+def _unknown_function_error(function_name: str) -> str:
+    """Tool output for a function we don't have, built once per name."""
+    return json_dumps({"error": f"Unknown function: {function_name}"})
+
+
+def execute_tool_calls(tool_calls) -> List[Dict[str, str]]:
     """
-    Handles tool calls requested by the assistant.
+    Executes the tool calls requested by the assistant.
     
-    When the assistant decides to use tools, we:
-    1. Extract the requested tool calls
-    2. Execute each tool with the provided arguments
-    3. Submit the results back to the run
+    All tools run concurrently with the provided arguments, and each result
+    is paired with its tool_call_id, ready to submit back to the run.
     """
-    tool_outputs = []
-    
-    # Process each tool call
-    for tool_call in run.required_action.submit_tool_outputs.tool_calls:
+    def execute(tool_call) -> str:
         function_name = tool_call.function.name
-        arguments = json.loads(tool_call.function.arguments)
+        try:
+            arguments = json_loads(tool_call.function.arguments)
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses this
+            return json_dumps({"error": f"Malformed arguments for {function_name}: {e}"})
         
         print(f"   📊 Calling: {function_name}({arguments})")
         
-        # Execute the function
-        if function_name in FUNCTION_MAP:
-            result = FUNCTION_MAP[function_name](**arguments)
-        else:
-            result = json.dumps({"error": f"Unknown function: {function_name}"})
+        if function_name not in FUNCTION_MAP:
+            return _unknown_function_error(function_name)
         
-        tool_outputs.append({
-            "tool_call_id": tool_call.id,
-            "output": result
-        })
+        # Report invalid arguments back to the assistant instead of calling the tool
+        try:
+            _TOOL_VALIDATORS[function_name](arguments)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return json_dumps({"error": f"Invalid arguments for {function_name}: {e.message}"})
+        
+        # One failing tool must not lose the other results in this batch
+        try:
+            return call_tool_cached(function_name, arguments)
+        except Exception as e:
+            return json_dumps({"error": str(e)})
+    
+    # CONCEPT: The assistant can request several tools at once (e.g. price
+    # lookups for 3 tickers). They are independent network calls, so we run
+    # them in parallel; map() keeps each output paired with its tool_call_id.
+    with ThreadPoolExecutor(max_workers=min(8, len(tool_calls)) or 1) as executor:
+        results = list(executor.map(execute, tool_calls))
+    
+    return [
+        {"tool_call_id": tool_call.id, "output": result}
+        for tool_call, result in zip(tool_calls, results)
+    ]
+
+
+def handle_tool_calls(thread_id: str, run) -> Any:
+    """
+    Handles tool calls requested by the assistant.
+    
+    When the assistant decides to use tools, we:
+    1. Extract the requested tool calls
+    2. Execute all tools concurrently with the provided arguments
+    3. Submit all results back to the run in one request
+    """
+    tool_outputs = execute_tool_calls(run.required_action.submit_tool_outputs.tool_calls)
     
     # Submit tool outputs back to the run
     run = client.beta.threads.runs.submit_tool_outputs(
@@ -580,6 +830,78 @@ def handle_tool_calls(thread_id: str, run) -> Any:
     return run
 
 
+# CONCEPT: Instead of polling, a run can be streamed. OpenAI pushes events
+# (run created, tool calls required, message done, ...) over one connection,
+# so there are no status requests and no follow-up call to fetch the reply -
+# the final message arrives as an event.
+
+class FinancialEventHandler(AssistantEventHandler):
+    """Collects the assistant's reply from a streamed run, running tools on request."""
+    
+    def __init__(self, quiet: bool = False):
+        super().__init__()
+        self.quiet = quiet
+        self.response: Optional[str] = None
+        self.error: Optional[str] = None
+    
+    def on_event(self, event) -> None:
+        if event.event == "thread.run.created" and not self.quiet:
+            print(f"🚀 Run started (ID: {event.data.id})")
+        
+        elif event.event == "thread.run.requires_action":
+            # The assistant wants to call tools!
+            print("🔧 Processing tool calls...")
+            run = event.data
+            tool_outputs = execute_tool_calls(run.required_action.submit_tool_outputs.tool_calls)
+            
+            # Submitting the outputs resumes the run on a new stream; its
+            # handler picks up the rest of the run, so copy its results back
+            handler = FinancialEventHandler(quiet=self.quiet)
+            with client.beta.threads.runs.submit_tool_outputs_stream(
+                thread_id=run.thread_id,
+                run_id=run.id,
+                tool_outputs=tool_outputs,
+                event_handler=handler
+            ) as stream:
+                stream.until_done()
+            self.response = handler.response or self.response
+            self.error = handler.error or self.error
+        
+        elif event.event == "thread.run.completed":
+            if not self.quiet:
+                print("✅ Run completed!")
+        
+        elif event.event in ("thread.run.failed", "thread.run.cancelled", "thread.run.expired"):
+            run = event.data
+            print(f"❌ Run {run.status}")
+            if run.last_error:
+                print(f"   Error: {run.last_error.message}")
+            self.error = f"Run {run.status}"
+    
+    def on_message_done(self, message) -> None:
+        self.response = message.content[0].text.value
+
+
+def run_assistant_streaming(assistant_id: str, thread_id: str, quiet: bool = False) -> str:
+    """
+    Runs the assistant on the thread as a stream and returns the response.
+    
+    Same lifecycle as run_assistant(), but driven by server events instead
+    of polling.
+    """
+    handler = FinancialEventHandler(quiet=quiet)
+    with client.beta.threads.runs.stream(
+        thread_id=thread_id,
+        assistant_id=assistant_id,
+        event_handler=handler
+    ) as stream:
+        stream.until_done()
+    
+    if handler.error:
+        return f"Error: {handler.error}"
+    return handler.response or "No response generated"
+
+
 # =============================================================================
 # STEP 7: HIGH-LEVEL CHAT FUNCTION
 # =============================================================================
@@ -587,21 +909,29 @@ def handle_tool_calls(thread_id: str, run) -> Any:
 def chat(
     assistant_id: str,
     thread_id: str,
-    user_message: str
+    user_message: str,
+    stream: bool = True,
+    quiet: bool = False
 ) -> str:
     """
     Complete chat interaction: send message, run assistant, get response.
+    
+    The run is streamed by default; pass stream=False to poll instead.
+    Set quiet to hide the run status updates.
     """
     print(f"\n🧑 User: {user_message}")
-    print("-" * 50)
+    print(_SEP50)
     
     # Add user message to thread
     add_message_to_thread(thread_id, user_message)
     
     # Run the assistant and get response
-    response = run_assistant(assistant_id, thread_id)
+    if stream:
+        response = run_assistant_streaming(assistant_id, thread_id, quiet=quiet)
+    else:
+        response = run_assistant(assistant_id, thread_id, quiet=quiet)
     
-    print("-" * 50)
+    print(_SEP50)
     print(f"🤖 Assistant:\n{response}")
     
     return response
@@ -610,14 +940,16 @@ def chat(
 # =============================================================================
 # STEP 8: CLEANUP FUNCTION
 # =============================================================================
-# CONCEPT: Assistants persist on OpenAI's servers and count towards your
-# usage. For demos, it's good practice to clean up when done.
+# CONCEPT: Assistants persist on OpenAI's servers. Since we cache and reuse
+# the assistant, it is only deleted when you ask for it with --cleanup.
 
 
 def cleanup_assistant(assistant_id: str) -> None:
-    """Deletes the assistant when we're done."""
+    """Deletes the assistant and forgets its cached ID."""
     try:
         client.beta.assistants.delete(assistant_id)
+        assistant_ids = _load_assistant_ids()
+        _save_assistant_ids({k: v for k, v in assistant_ids.items() if v != assistant_id})
         print(f"🧹 Cleaned up assistant {assistant_id}")
     except Exception as e:
         print(f"⚠️  Could not delete assistant: {e}")
@@ -627,11 +959,11 @@ def cleanup_assistant(assistant_id: str) -> None:
 # STEP 9: DEMO FUNCTIONS
 # =============================================================================
 
-def run_interactive_demo():
+def run_interactive_demo(cleanup: bool = False, quiet: bool = False):
     """Interactive chat session with the Assistants API."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP70)
     print("🚀 OPENAI ASSISTANTS API DEMO: Financial Research Analyst")
-    print("=" * 70)
+    print(_SEP70)
     print("""
 This demo shows OpenAI's Assistants API - a more sophisticated approach
 to building AI agents with:
@@ -654,7 +986,7 @@ Example questions:
 
 Type 'quit' to exit.
 """)
-    print("=" * 70)
+    print(_SEP70)
     
     # Create assistant and thread
     assistant_id = get_or_create_assistant()
@@ -673,21 +1005,21 @@ Type 'quit' to exit.
             if user_input.lower() in ['quit', 'exit', 'q']:
                 break
             
-            chat(assistant_id, thread_id, user_input)
+            chat(assistant_id, thread_id, user_input, quiet=quiet)
             
     except KeyboardInterrupt:
         print("\n\nInterrupted.")
     finally:
-        # Clean up
         print("\n👋 Goodbye!")
-        cleanup_assistant(assistant_id)
+        if cleanup:
+            cleanup_assistant(assistant_id)
 
 
-def run_scripted_demo():
+def run_scripted_demo(cleanup: bool = False, quiet: bool = False):
     """Scripted demonstration for presentations."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP70)
     print("🚀 OPENAI ASSISTANTS API: Scripted Demonstration")
-    print("=" * 70)
+    print(_SEP70)
     print("\nThis demonstrates the full capabilities of the Assistants API")
     print("for financial research and analysis.\n")
     
@@ -703,19 +1035,19 @@ def run_scripted_demo():
     
     try:
         for i, query in enumerate(demo_queries, 1):
-            print(f"\n{'='*70}")
+            print("\n" + _SEP70)
             print(f"📝 Demo Query {i}/{len(demo_queries)}")
-            print("=" * 70)
+            print(_SEP70)
             
-            chat(assistant_id, thread_id, query)
+            chat(assistant_id, thread_id, query, quiet=quiet)
             
             if i < len(demo_queries):
                 print("\n⏳ Continuing to next query...")
                 time.sleep(2)
         
-        print("\n" + "=" * 70)
+        print("\n" + _SEP70)
         print("🎓 DEMO COMPLETE: Key Takeaways")
-        print("=" * 70)
+        print(_SEP70)
         print("""
 1. PERSISTENCE: The assistant remembers context across the conversation
    
@@ -738,10 +1070,11 @@ ASSISTANTS API ADVANTAGES:
   ✓ Reliable tool handling - automatic retries
   ✓ Scalable - same assistant for all users
 """)
-        print("=" * 70)
+        print(_SEP70)
         
     finally:
-        cleanup_assistant(assistant_id)
+        if cleanup:
+            cleanup_assistant(assistant_id)
 
 
 # =============================================================================
@@ -759,9 +1092,19 @@ if __name__ == "__main__":
         action="store_true",
         help="Run scripted demo instead of interactive mode"
     )
+    parser.add_argument(
+        "--cleanup",
+        action="store_true",
+        help="Delete the assistant when done instead of keeping it for the next run"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Hide run status updates"
+    )
     args = parser.parse_args()
     
     if args.scripted:
-        run_scripted_demo()
+        run_scripted_demo(cleanup=args.cleanup, quiet=args.quiet)
     else:
-        run_interactive_demo()
+        run_interactive_demo(cleanup=args.cleanup, quiet=args.quiet)